@@ -1,5 +1,12 @@
+from .aggregation import (
+    PubkeyAggregator,
+    SignatureAggregator,
+)
 from .ciphersuites import (
     G2Basic,
     G2MessageAugmentation,
     G2ProofOfPossession,
 )
+from .parallel import (
+    ParallelVerifier,
+)
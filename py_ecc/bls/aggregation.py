@@ -0,0 +1,168 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from collections import (
+    Counter,
+)
+from collections.abc import (
+    Iterable,
+)
+from typing import (
+    Generic,
+    TypeVar,
+)
+
+from eth_typing import (
+    BLSPubkey,
+    BLSSignature,
+)
+from eth_utils import (
+    ValidationError,
+)
+
+from py_ecc.fields import (
+    optimized_bls12_381_FQ as FQ,
+    optimized_bls12_381_FQ2 as FQ2,
+)
+from py_ecc.optimized_bls12_381 import (
+    Z1,
+    Z2,
+    add as add_points,
+    neg,
+)
+from py_ecc.typing import (
+    Optimized_Field,
+    Optimized_Point3D,
+)
+
+from .cache import (
+    pubkey_cache,
+)
+from .g2_primitives import (
+    G1_to_pubkey,
+    G2_to_signature,
+    pubkey_to_G1,
+    signature_to_G2,
+)
+from .typing import (
+    G1Uncompressed,
+    G2Uncompressed,
+)
+
+T = TypeVar("T", bound=bytes)
+
+
+class _Aggregator(ABC, Generic[T, Optimized_Field]):
+    """
+    A running sum of encoded points, kept in projective coordinates. Adding or
+    removing one element costs a decompression and a point addition; the sum is
+    only compressed on demand.
+    """
+
+    name = ""
+    encoding_length = 0
+
+    def __init__(self, elements: Iterable[T] = ()) -> None:
+        self.point: Optimized_Point3D[Optimized_Field] = self._zero()
+        # How many times each element is part of the sum
+        self.members: Counter[T] = Counter()
+        for element in elements:
+            self.add(element)
+
+    @abstractmethod
+    def _zero(self) -> Optimized_Point3D[Optimized_Field]:
+        ...
+
+    @abstractmethod
+    def _decode(self, element: T) -> Optimized_Point3D[Optimized_Field]:
+        ...
+
+    @abstractmethod
+    def _encode(self, point: Optimized_Point3D[Optimized_Field]) -> T:
+        ...
+
+    def _to_point(self, element: T) -> Optimized_Point3D[Optimized_Field]:
+        if not (isinstance(element, bytes) and len(element) == self.encoding_length):
+            raise ValidationError(f"Invalid {self.name}")
+        return self._decode(element)
+
+    def add(self, element: T) -> None:
+        self.point = add_points(self.point, self._to_point(element))
+        self.members[element] += 1
+
+    def remove(self, element: T) -> None:
+        """
+        Remove an element that was previously added.
+
+        Raise `ValidationError` when the element is not part of the aggregate.
+        """
+        if self.members[element] < 1:
+            raise ValidationError(f"The {self.name} is not part of the aggregate")
+        self.point = add_points(self.point, neg(self._to_point(element)))
+        self.members[element] -= 1
+        if not self.members[element]:
+            del self.members[element]
+
+    def merge(self, other: "_Aggregator[T, Optimized_Field]") -> None:
+        """
+        Add every element of another aggregate of the same kind.
+        """
+        if type(other) is not type(self):
+            raise ValidationError(
+                f"Cannot merge {type(other).__name__} into {type(self).__name__}"
+            )
+        self.point = add_points(self.point, other.point)
+        self.members.update(other.members)
+
+    def aggregate(self) -> T:
+        """
+        The compressed aggregate, as returned by the ciphersuites' aggregation.
+
+        Raise `ValidationError` when the aggregate is empty.
+        """
+        if not self.members:
+            raise ValidationError(f"Insufficient number of {self.name}s. (n < 1)")
+        return self._encode(self.point)
+
+    def __len__(self) -> int:
+        return self.members.total()
+
+
+class SignatureAggregator(_Aggregator[BLSSignature, FQ2]):
+    """
+    Incremental counterpart of `Aggregate`.
+    """
+
+    name = "signature"
+    encoding_length = 96
+
+    def _zero(self) -> G2Uncompressed:
+        return Z2
+
+    def _decode(self, signature: BLSSignature) -> G2Uncompressed:
+        return signature_to_G2(signature)
+
+    def _encode(self, point: G2Uncompressed) -> BLSSignature:
+        return G2_to_signature(point)
+
+
+class PubkeyAggregator(_Aggregator[BLSPubkey, FQ]):
+    """
+    Incremental counterpart of `G2ProofOfPossession._AggregatePKs`.
+    """
+
+    name = "public key"
+    encoding_length = 48
+
+    def _zero(self) -> G1Uncompressed:
+        return Z1
+
+    def _decode(self, PK: BLSPubkey) -> G1Uncompressed:
+        pubkey_point = pubkey_cache.get(PK)
+        if pubkey_point is None:
+            pubkey_point = pubkey_to_G1(PK)
+        return pubkey_point
+
+    def _encode(self, point: G1Uncompressed) -> BLSPubkey:
+        return G1_to_pubkey(point)
@@ -0,0 +1,107 @@
+from collections import (
+    OrderedDict,
+)
+from collections.abc import (
+    Hashable,
+)
+from threading import (
+    Lock,
+)
+from typing import (
+    Generic,
+    TypeVar,
+)
+
+from .constants import (
+    MESSAGE_POINT_CACHE_SIZE,
+    PUBKEY_CACHE_SIZE,
+)
+from .hash import (
+    HashFunction,
+)
+from .typing import (
+    G1Uncompressed,
+    G2Uncompressed,
+)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    A mapping holding at most `maxsize` entries, evicting the least recently used
+    one when full. A `maxsize` of 0 disables the cache: nothing is stored and
+    every lookup misses without being counted.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 0:
+            raise ValueError(f"Cache size should be non-negative. Got {maxsize}")
+        self._maxsize = maxsize
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def resize(self, maxsize: int) -> None:
+        """
+        Change the capacity, evicting the least recently used entries that no
+        longer fit. `resize(0)` disables the cache.
+        """
+        if maxsize < 0:
+            raise ValueError(f"Cache size should be non-negative. Got {maxsize}")
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """
+        Drop every entry and reset the hit and miss counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get(self, key: K) -> V | None:
+        if not self._maxsize:
+            return None
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return value
+
+    def put(self, key: K, value: V) -> None:
+        if not self._maxsize:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+
+# Public keys that passed `KeyValidate`, mapped to their decoded G1 points
+pubkey_cache: LRUCache[bytes, G1Uncompressed] = LRUCache(PUBKEY_CACHE_SIZE)
+
+# `hash_to_G2` outputs, keyed by (message, DST, hash function). Disabled by
+# default: enable it with `message_point_cache.resize(n)`.
+message_point_cache: LRUCache[
+    tuple[bytes, bytes, HashFunction], G2Uncompressed
+] = LRUCache(MESSAGE_POINT_CACHE_SIZE)
@@ -5,6 +5,9 @@ from abc import (
 from collections.abc import (
     Sequence,
 )
+from concurrent.futures import (
+    Executor,
+)
 from hashlib import (
     sha256,
 )
@@ -12,6 +15,15 @@ from math import (
     ceil,
     log2,
 )
+from os import (
+    cpu_count,
+)
+from secrets import (
+    randbelow,
+)
+from typing import (
+    TypeVar,
+)
 
 from eth_typing import (
     BLSPubkey,
@@ -22,6 +34,7 @@ from eth_utils import (
 )
 
 from py_ecc.fields import (
+    optimized_bls12_381_FQ as FQ,
     optimized_bls12_381_FQ12 as FQ12,
 )
 from py_ecc.optimized_bls12_381 import (
@@ -29,22 +42,34 @@ from py_ecc.optimized_bls12_381 import (
     Z1,
     Z2,
     add,
+    batch_normalize,
     curve_order,
     final_exponentiate,
-    multiply,
+    multi_pairing,
+    multi_scalar_multiply,
+    multiply_G1,
+    multiply_gls_G2,
     neg,
-    pairing,
 )
 
+from .cache import (
+    message_point_cache,
+    pubkey_cache,
+)
+from .constants import (
+    BATCH_VERIFY_SCALAR_BITS,
+)
 from .g2_primitives import (
     G1_to_pubkey,
     G2_to_signature,
     is_inf,
     pubkey_to_G1,
     signature_to_G2,
-    subgroup_check,
+    subgroup_check_G1,
+    subgroup_check_G2,
 )
 from .hash import (
+    HashFunction,
     hkdf_expand,
     hkdf_extract,
     i2osp,
@@ -53,6 +78,149 @@ from .hash import (
 from .hash_to_curve import (
     hash_to_G2,
 )
+from .point_compression import (
+    decompress_G1_batch,
+)
+from .typing import (
+    G1Compressed,
+    G1Uncompressed,
+    G2Uncompressed,
+)
+
+T = TypeVar("T")
+
+
+def _key_validate_point(PK: BLSPubkey) -> G1Uncompressed | None:
+    """
+    The decoded point of a public key that passes `KeyValidate`, or None.
+    Valid keys are looked up in and added to `pubkey_cache`.
+    """
+    cacheable = isinstance(PK, bytes)
+    if cacheable:
+        pubkey_point = pubkey_cache.get(PK)
+        if pubkey_point is not None:
+            return pubkey_point
+    try:
+        pubkey_point = pubkey_to_G1(PK)
+    except (ValidationError, ValueError, AssertionError):
+        return None
+    if is_inf(pubkey_point) or not subgroup_check_G1(pubkey_point):
+        return None
+    if cacheable:
+        pubkey_cache.put(PK, pubkey_point)
+    return pubkey_point
+
+
+def _message_point(
+    message: bytes, DST: bytes, hash_function: HashFunction
+) -> G2Uncompressed:
+    """
+    `hash_to_G2`, looked up in and added to `message_point_cache`.
+    """
+    key = (message, DST, hash_function)
+    message_point = message_point_cache.get(key)
+    if message_point is None:
+        message_point = hash_to_G2(message, DST, hash_function)
+        message_point_cache.put(key, message_point)
+    return message_point
+
+
+def _chunks(items: Sequence[T], parts: int) -> list[Sequence[T]]:
+    """
+    Split `items` into at most `parts` consecutive chunks of about equal length.
+    """
+    size = ceil(len(items) / parts)
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def _partial_miller_loop(
+    pairs: Sequence[tuple[tuple[int, int], bytes]],
+    DST: bytes,
+    hash_function: HashFunction,
+) -> tuple[int, ...]:
+    """
+    The coefficients of the product of the Miller loops of (H(message), PK) over
+    some of the pairs of an aggregate verification, with every PK given by its
+    affine coordinates.
+    """
+    f = multi_pairing(
+        [
+            (_message_point(message, DST, hash_function), (FQ(x), FQ(y), FQ.one()))
+            for (x, y), message in pairs
+        ],
+        final_exponentiate=False,
+    )
+    return tuple(int(c) for c in f.coeffs)
+
+
+def _parallel_miller_loop(
+    pubkey_points: Sequence[G1Uncompressed],
+    messages: Sequence[bytes],
+    DST: bytes,
+    hash_function: HashFunction,
+    executor: Executor,
+) -> FQ12:
+    """
+    The product of the Miller loops of (H(message), PK) over all the pairs,
+    computed by `_partial_miller_loop` in the workers of `executor`.
+    """
+    pairs = [
+        ((int(x), int(y)), message)
+        for (x, y), message in zip(batch_normalize(pubkey_points), messages)
+    ]
+    chunks = _chunks(pairs, cpu_count() or 1)
+    partials = executor.map(
+        _partial_miller_loop,
+        chunks,
+        [DST] * len(chunks),
+        [hash_function] * len(chunks),
+    )
+    f = FQ12.one()
+    for coeffs in partials:
+        f *= FQ12(coeffs)
+    return f
+
+
+def _decode_pubkey_points(
+    zs: Sequence[G1Compressed],
+) -> list[G1Uncompressed | None]:
+    """
+    The decoded point of every compressed public key that passes `KeyValidate`,
+    or None. Runs in worker processes, so it does not touch `pubkey_cache`.
+    """
+    return [
+        pt if pt is not None and not is_inf(pt) and subgroup_check_G1(pt) else None
+        for pt in decompress_G1_batch(zs)
+    ]
+
+
+def _key_validate_points(
+    PKs: Sequence[BLSPubkey], executor: Executor | None = None
+) -> list[G1Uncompressed | None]:
+    """
+    The decoded point of every public key that passes `KeyValidate`, or None.
+    Valid keys are looked up in and added to `pubkey_cache`; the keys missing
+    from it are decoded in `executor` when one is given.
+    """
+    points = [pubkey_cache.get(PK) if isinstance(PK, bytes) else None for PK in PKs]
+    missing = [i for i, pt in enumerate(points) if pt is None]
+    zs = [G1Compressed(os2ip(PKs[i])) for i in missing]
+    if executor is None or len(zs) < 2:
+        decoded = _decode_pubkey_points(zs)
+    else:
+        decoded = [
+            pt
+            for chunk in executor.map(
+                _decode_pubkey_points, _chunks(zs, cpu_count() or 1)
+            )
+            for pt in chunk
+        ]
+    for i, pt in zip(missing, decoded):
+        if pt is not None:
+            points[i] = pt
+            if isinstance(PKs[i], bytes):
+                pubkey_cache.put(PKs[i], pt)
+    return points
 
 
 class BaseG2Ciphersuite(ABC):
@@ -95,7 +263,7 @@ class BaseG2Ciphersuite(ABC):
             raise ValidationError("Invalid private key")
 
         # Procedure
-        return G1_to_pubkey(multiply(G1, privkey))
+        return G1_to_pubkey(multiply_G1(privkey))
 
     @classmethod
     def KeyGen(cls, IKM: bytes, key_info: bytes = b"") -> int:
@@ -111,18 +279,42 @@ class BaseG2Ciphersuite(ABC):
 
     @staticmethod
     def KeyValidate(PK: BLSPubkey) -> bool:
-        try:
-            pubkey_point = pubkey_to_G1(PK)
-        except (ValidationError, ValueError, AssertionError):
-            return False
+        return _key_validate_point(PK) is not None
 
-        if is_inf(pubkey_point):
-            return False
+    @classmethod
+    def _validated_pubkey_point(cls, PK: BLSPubkey) -> G1Uncompressed | None:
+        """
+        The decoded point of a public key that passes `cls.KeyValidate`, or None.
+        Unless a subclass overrides `KeyValidate`, validation and decoding share
+        a single lookup in `pubkey_cache`.
+        """
+        if cls.KeyValidate is not BaseG2Ciphersuite.KeyValidate:
+            if not cls.KeyValidate(PK):
+                return None
+            return pubkey_to_G1(PK)
+        return _key_validate_point(PK)
 
-        if not subgroup_check(pubkey_point):
-            return False
+    @staticmethod
+    def KeyValidateBatch(
+        PKs: Sequence[BLSPubkey] | bytes | bytearray | memoryview,
+        executor: Executor | None = None,
+    ) -> list[G1Uncompressed | None]:
+        """
+        Validate many public keys at once, given as a sequence or as a buffer of
+        concatenated 48-byte keys. Returns, for every key, its decoded point if it
+        passes `KeyValidate`, and None otherwise.
+
+        With an `executor`, the keys missing from `pubkey_cache` are decoded in
+        its workers; the executor is reused as is and left running.
 
-        return True
+        Raise `ValidationError` when a buffer is not made of 48-byte keys.
+        """
+        if isinstance(PKs, (bytes, bytearray, memoryview)):
+            buffer = bytes(PKs)
+            if len(buffer) % 48:
+                raise ValidationError("Buffer length is not a multiple of 48 bytes")
+            PKs = [BLSPubkey(buffer[i : i + 48]) for i in range(0, len(buffer), 48)]
+        return _key_validate_points(PKs, executor)
 
     @classmethod
     def _CoreSign(cls, SK: int, message: bytes, DST: bytes) -> BLSSignature:
@@ -139,8 +331,8 @@ class BaseG2Ciphersuite(ABC):
             raise ValidationError("Invalid message")
 
         # Procedure
-        message_point = hash_to_G2(message, DST, cls.xmd_hash_function)
-        signature_point = multiply(message_point, SK)
+        message_point = _message_point(message, DST, cls.xmd_hash_function)
+        signature_point = multiply_gls_G2(message_point, SK)
         return G2_to_signature(signature_point)
 
     @classmethod
@@ -157,27 +349,39 @@ class BaseG2Ciphersuite(ABC):
                 raise ValidationError("Invalid signature")
 
             # Procedure
-            if not cls.KeyValidate(PK):
+            pubkey_point = cls._validated_pubkey_point(PK)
+            if pubkey_point is None:
                 raise ValidationError("Invalid public key")
-            signature_point = signature_to_G2(signature)
-            if not subgroup_check(signature_point):
-                return False
-            final_exponentiation = final_exponentiate(
-                pairing(
-                    signature_point,
-                    G1,
-                    final_exponentiate=False,
-                )
-                * pairing(
-                    hash_to_G2(message, DST, cls.xmd_hash_function),
-                    neg(pubkey_to_G1(PK)),
-                    final_exponentiate=False,
-                )
-            )
-            return final_exponentiation == FQ12.one()
+            return cls._verify_point(pubkey_point, message, signature, DST)
         except (ValidationError, ValueError, AssertionError):
             return False
 
+    @classmethod
+    def _verify_point(
+        cls,
+        pubkey_point: G1Uncompressed,
+        message: bytes,
+        signature: BLSSignature,
+        DST: bytes,
+    ) -> bool:
+        """
+        The procedure of `_CoreVerify` for a public key already validated and
+        decoded to `pubkey_point`.
+        """
+        signature_point = signature_to_G2(signature)
+        if not subgroup_check_G2(signature_point):
+            return False
+        final_exponentiation = multi_pairing(
+            [
+                (signature_point, G1),
+                (
+                    _message_point(message, DST, cls.xmd_hash_function),
+                    neg(pubkey_point),
+                ),
+            ]
+        )
+        return final_exponentiation == FQ12.one()
+
     @classmethod
     def Aggregate(cls, signatures: Sequence[BLSSignature]) -> BLSSignature:
         """
@@ -208,7 +412,13 @@ class BaseG2Ciphersuite(ABC):
         messages: Sequence[bytes],
         signature: BLSSignature,
         DST: bytes,
+        executor: Executor | None = None,
     ) -> bool:
+        """
+        With an `executor`, the Miller loops of the (message, PK) pairs are split
+        across its workers, and the final exponentiation is done once on the
+        product of their results. The executor is reused as is and left running.
+        """
         try:
             # Inputs validation
             for pk in PKs:
@@ -228,23 +438,146 @@ class BaseG2Ciphersuite(ABC):
 
             # Procedure
             signature_point = signature_to_G2(signature)
-            if not subgroup_check(signature_point):
+            if not subgroup_check_G2(signature_point):
                 return False
-            aggregate = FQ12.one()
-            for pk, message in zip(PKs, messages):
-                if not cls.KeyValidate(pk):
+            pubkey_points = []
+            for pk in PKs:
+                pubkey_point = cls._validated_pubkey_point(pk)
+                if pubkey_point is None:
                     raise ValidationError("Invalid public key")
-                pubkey_point = pubkey_to_G1(pk)
-                message_point = hash_to_G2(message, DST, cls.xmd_hash_function)
-                aggregate *= pairing(
-                    message_point, pubkey_point, final_exponentiate=False
+                pubkey_points.append(pubkey_point)
+            if executor is not None and len(PKs) > 1:
+                f = _parallel_miller_loop(
+                    pubkey_points, messages, DST, cls.xmd_hash_function, executor
+                )
+                f *= multi_pairing(
+                    [(signature_point, neg(G1))], final_exponentiate=False
                 )
-            aggregate *= pairing(signature_point, neg(G1), final_exponentiate=False)
-            return final_exponentiate(aggregate) == FQ12.one()
+                return final_exponentiate(f) == FQ12.one()
+            pairs = [
+                (_message_point(message, DST, cls.xmd_hash_function), pubkey_point)
+                for pubkey_point, message in zip(pubkey_points, messages)
+            ]
+            pairs.append((signature_point, neg(G1)))
+            return multi_pairing(pairs) == FQ12.one()
 
         except (ValidationError, ValueError, AssertionError):
             return False
 
+    @classmethod
+    def _decode_batch(
+        cls,
+        triples: Sequence[tuple[BLSPubkey, bytes, BLSSignature]],
+    ) -> list[tuple[G1Uncompressed, bytes, G2Uncompressed] | None]:
+        """
+        Validate and decompress every (PK, message, signature) triple of a batch.
+        Triples that fail validation are replaced by `None`.
+        """
+        decoded: list[tuple[G1Uncompressed, bytes, G2Uncompressed] | None] = []
+        for PK, message, signature in triples:
+            try:
+                if not cls._is_valid_pubkey(PK):
+                    raise ValidationError("Invalid public key")
+                if not cls._is_valid_message(message):
+                    raise ValidationError("Invalid message")
+                if not cls._is_valid_signature(signature):
+                    raise ValidationError("Invalid signature")
+                pubkey_point = cls._validated_pubkey_point(PK)
+                if pubkey_point is None:
+                    raise ValidationError("Invalid public key")
+                signature_point = signature_to_G2(signature)
+                if not subgroup_check_G2(signature_point):
+                    raise ValidationError("Invalid signature")
+                decoded.append((pubkey_point, message, signature_point))
+            except (ValidationError, ValueError, AssertionError):
+                decoded.append(None)
+        return decoded
+
+    @classmethod
+    def _batch_check(
+        cls,
+        points: Sequence[tuple[G1Uncompressed, bytes, G2Uncompressed]],
+        DST: bytes,
+        message_points: dict[bytes, G2Uncompressed],
+    ) -> bool:
+        """
+        Check a batch of decoded triples with a random linear combination:
+
+            e(sum(r_i * sig_i), -G1) * prod(e(H(m_i), r_i * PK_i)) == 1
+
+        where the r_i are fresh random scalars of `BATCH_VERIFY_SCALAR_BITS` bits.
+        Public keys signing the same message are summed so that every distinct
+        message costs one Miller loop. `message_points` caches the hashed messages
+        across calls.
+        """
+        rs = [randbelow(2**BATCH_VERIFY_SCALAR_BITS - 1) + 1 for _ in points]
+        aggregate_signature = multi_scalar_multiply(
+            [signature_point for _, _, signature_point in points], rs
+        )
+        pubkeys_by_message: dict[bytes, tuple[list[G1Uncompressed], list[int]]] = {}
+        for (pubkey_point, message, _), r in zip(points, rs):
+            pubkeys, scalars = pubkeys_by_message.setdefault(message, ([], []))
+            pubkeys.append(pubkey_point)
+            scalars.append(r)
+
+        pairs = []
+        for message, (pubkeys, scalars) in pubkeys_by_message.items():
+            if message not in message_points:
+                message_points[message] = _message_point(
+                    message, DST, cls.xmd_hash_function
+                )
+            pairs.append(
+                (message_points[message], multi_scalar_multiply(pubkeys, scalars))
+            )
+        pairs.append((aggregate_signature, neg(G1)))
+        return multi_pairing(pairs) == FQ12.one()
+
+    @classmethod
+    def _CoreBatchVerify(
+        cls,
+        triples: Sequence[tuple[BLSPubkey, bytes, BLSSignature]],
+        DST: bytes,
+    ) -> bool:
+        if len(triples) < 1:
+            return False
+        decoded = cls._decode_batch(triples)
+        if any(triple is None for triple in decoded):
+            return False
+        return cls._batch_check(
+            [triple for triple in decoded if triple is not None], DST, {}
+        )
+
+    @classmethod
+    def _CoreBatchFindInvalid(
+        cls,
+        triples: Sequence[tuple[BLSPubkey, bytes, BLSSignature]],
+        DST: bytes,
+    ) -> list[int]:
+        decoded = cls._decode_batch(triples)
+        invalid = [i for i, triple in enumerate(decoded) if triple is None]
+        message_points: dict[bytes, G2Uncompressed] = {}
+
+        # Bisect the well-formed triples until every failing batch is a single
+        # triple
+        pending = [[i for i, triple in enumerate(decoded) if triple is not None]]
+        while pending:
+            indices = pending.pop()
+            if not indices:
+                continue
+            batch = [decoded[i] for i in indices]
+            if cls._batch_check(
+                [triple for triple in batch if triple is not None],
+                DST,
+                message_points,
+            ):
+                continue
+            if len(indices) == 1:
+                invalid.append(indices[0])
+            else:
+                middle = len(indices) // 2
+                pending.extend((indices[middle:], indices[:middle]))
+        return sorted(invalid)
+
     @classmethod
     def Sign(cls, SK: int, message: bytes) -> BLSSignature:
         return cls._CoreSign(SK, message, cls.DST)
@@ -253,6 +586,28 @@ class BaseG2Ciphersuite(ABC):
     def Verify(cls, PK: BLSPubkey, message: bytes, signature: BLSSignature) -> bool:
         return cls._CoreVerify(PK, message, signature, cls.DST)
 
+    @classmethod
+    def BatchVerify(
+        cls, triples: Sequence[tuple[BLSPubkey, bytes, BLSSignature]]
+    ) -> bool:
+        """
+        Verify many independent (PK, message, signature) triples at once.
+
+        Returns True iff every triple would pass `Verify`, up to a 2**-64
+        probability of accepting a batch that contains an invalid signature.
+        """
+        return cls._CoreBatchVerify(triples, cls.DST)
+
+    @classmethod
+    def BatchFindInvalid(
+        cls, triples: Sequence[tuple[BLSPubkey, bytes, BLSSignature]]
+    ) -> list[int]:
+        """
+        Return the sorted indices of the triples that fail verification,
+        locating them by bisecting the batch.
+        """
+        return cls._CoreBatchFindInvalid(triples, cls.DST)
+
     @classmethod
     @abstractmethod
     def AggregateVerify(
@@ -260,6 +615,8 @@ class BaseG2Ciphersuite(ABC):
         PKs: Sequence[BLSPubkey],
         messages: Sequence[bytes],
         signature: BLSSignature,
+        *,
+        executor: Executor | None = None,
     ) -> bool:
         ...
 
@@ -273,10 +630,12 @@ class G2Basic(BaseG2Ciphersuite):
         PKs: Sequence[BLSPubkey],
         messages: Sequence[bytes],
         signature: BLSSignature,
+        *,
+        executor: Executor | None = None,
     ) -> bool:
         if len(messages) != len(set(messages)):  # Messages are not unique
             return False
-        return cls._CoreAggregateVerify(PKs, messages, signature, cls.DST)
+        return cls._CoreAggregateVerify(PKs, messages, signature, cls.DST, executor)
 
 
 class G2MessageAugmentation(BaseG2Ciphersuite):
@@ -291,17 +650,33 @@ class G2MessageAugmentation(BaseG2Ciphersuite):
     def Verify(cls, PK: BLSPubkey, message: bytes, signature: BLSSignature) -> bool:
         return cls._CoreVerify(PK, PK + message, signature, cls.DST)
 
+    @classmethod
+    def BatchVerify(
+        cls, triples: Sequence[tuple[BLSPubkey, bytes, BLSSignature]]
+    ) -> bool:
+        triples = [(PK, PK + message, signature) for PK, message, signature in triples]
+        return cls._CoreBatchVerify(triples, cls.DST)
+
+    @classmethod
+    def BatchFindInvalid(
+        cls, triples: Sequence[tuple[BLSPubkey, bytes, BLSSignature]]
+    ) -> list[int]:
+        triples = [(PK, PK + message, signature) for PK, message, signature in triples]
+        return cls._CoreBatchFindInvalid(triples, cls.DST)
+
     @classmethod
     def AggregateVerify(
         cls,
         PKs: Sequence[BLSPubkey],
         messages: Sequence[bytes],
         signature: BLSSignature,
+        *,
+        executor: Executor | None = None,
     ) -> bool:
         if len(PKs) != len(messages):
             return False
         messages = [pk + msg for pk, msg in zip(PKs, messages)]
-        return cls._CoreAggregateVerify(PKs, messages, signature, cls.DST)
+        return cls._CoreAggregateVerify(PKs, messages, signature, cls.DST, executor)
 
 
 class G2ProofOfPossession(BaseG2Ciphersuite):
@@ -327,8 +702,10 @@ class G2ProofOfPossession(BaseG2Ciphersuite):
         PKs: Sequence[BLSPubkey],
         messages: Sequence[bytes],
         signature: BLSSignature,
+        *,
+        executor: Executor | None = None,
     ) -> bool:
-        return cls._CoreAggregateVerify(PKs, messages, signature, cls.DST)
+        return cls._CoreAggregateVerify(PKs, messages, signature, cls.DST, executor)
 
     @classmethod
     def PopProve(cls, SK: int) -> BLSSignature:
@@ -339,11 +716,20 @@ class G2ProofOfPossession(BaseG2Ciphersuite):
     def PopVerify(cls, PK: BLSPubkey, proof: BLSSignature) -> bool:
         return cls._CoreVerify(PK, PK, proof, cls.POP_TAG)
 
-    @staticmethod
-    def _AggregatePKs(PKs: Sequence[BLSPubkey]) -> BLSPubkey:
+    @classmethod
+    def _AggregatePKs(cls, PKs: Sequence[BLSPubkey]) -> BLSPubkey:
         """
         Aggregate the public keys.
 
+        Raise `ValidationError` when there is input validation error.
+        """
+        return G1_to_pubkey(cls._aggregate_pubkey_point(PKs))
+
+    @staticmethod
+    def _aggregate_pubkey_point(PKs: Sequence[BLSPubkey]) -> G1Uncompressed:
+        """
+        The aggregate public key of `_AggregatePKs`, before compression.
+
         Raise `ValidationError` when there is input validation error.
         """
         if len(PKs) < 1:
@@ -351,9 +737,11 @@ class G2ProofOfPossession(BaseG2Ciphersuite):
 
         aggregate = Z1  # Seed with the point at infinity
         for pk in PKs:
-            pubkey_point = pubkey_to_G1(pk)
+            pubkey_point = pubkey_cache.get(pk)
+            if pubkey_point is None:
+                pubkey_point = pubkey_to_G1(pk)
             aggregate = add(aggregate, pubkey_point)
-        return G1_to_pubkey(aggregate)
+        return aggregate
 
     @classmethod
     def FastAggregateVerify(
@@ -374,8 +762,11 @@ class G2ProofOfPossession(BaseG2Ciphersuite):
                 raise ValidationError("Insufficient number of PKs. (n < 1)")
 
             # Procedure
-            aggregate_pubkey = cls._AggregatePKs(PKs)
-        except (ValidationError, AssertionError):
+            # The aggregate public key is used once: it is validated here rather
+            # than through `KeyValidate`, so that it stays out of `pubkey_cache`
+            aggregate_point = cls._aggregate_pubkey_point(PKs)
+            if is_inf(aggregate_point) or not subgroup_check_G1(aggregate_point):
+                return False
+            return cls._verify_point(aggregate_point, message, signature, cls.DST)
+        except (ValidationError, ValueError, AssertionError):
             return False
-        else:
-            return cls.Verify(aggregate_pubkey, message, signature)
@@ -17,3 +17,13 @@ POW_2_384 = 2**384
 # Parameters for hashing to the field as specified in:
 # https://tools.ietf.org/html/draft-irtf-cfrg-hash-to-curve-09#section-8.8.1
 HASH_TO_FIELD_L = 64
+
+# Bit length of the random scalars weighting each signature in batch verification
+BATCH_VERIFY_SCALAR_BITS = 64
+
+# Number of validated public keys remembered by `py_ecc.bls.cache.pubkey_cache`
+PUBKEY_CACHE_SIZE = 2**14
+
+# Number of `hash_to_G2` outputs remembered by
+# `py_ecc.bls.cache.message_point_cache`. The cache is opt-in.
+MESSAGE_POINT_CACHE_SIZE = 0
@@ -5,8 +5,13 @@ from eth_typing import (
 
 from py_ecc.optimized_bls12_381 import (
     curve_order,
+    eq,
     is_inf,
-    multiply,
+    multiply_by_x,
+    multiply_wnaf,
+    neg,
+    phi,
+    psi,
 )
 from py_ecc.typing import (
     Optimized_Field,
@@ -32,7 +37,20 @@ from .typing import (
 
 
 def subgroup_check(P: Optimized_Point3D[Optimized_Field]) -> bool:
-    return is_inf(multiply(P, curve_order))
+    return is_inf(multiply_wnaf(P, curve_order))
+
+
+# Subgroup checks with the endomorphisms, from Scott, "A note on group membership
+# tests for G1, G2 and GT on BLS pairing-friendly curves"
+# https://eprint.iacr.org/2021/1130
+# A point of E(FQ) is in G1 iff phi(P) == -x**2 * P
+def subgroup_check_G1(P: G1Uncompressed) -> bool:
+    return eq(phi(P), neg(multiply_by_x(multiply_by_x(P))))
+
+
+# A point of E'(FQ2) is in G2 iff psi(P) == x * P
+def subgroup_check_G2(P: G2Uncompressed) -> bool:
+    return eq(psi(P), multiply_by_x(P))
 
 
 def G2_to_signature(pt: G2Uncompressed) -> BLSSignature:
@@ -8,9 +8,9 @@ from py_ecc.optimized_bls12_381 import (
     iso_map_G1,
     iso_map_G2,
     multiply_clear_cofactor_G1,
-    multiply_clear_cofactor_G2,
     optimized_swu_G1,
     optimized_swu_G2,
+    psi_clear_cofactor_G2,
 )
 
 from .constants import (
@@ -89,11 +89,11 @@ def map_to_curve_G2(u: FQ2) -> G2Uncompressed:
 
 def clear_cofactor_G2(p: G2Uncompressed) -> G2Uncompressed:
     """
-    Clear Cofactor via Multiplication
+    Clear Cofactor via the psi endomorphism
 
     Ensure a point falls in the correct sub group of the curve.
     """
-    return multiply_clear_cofactor_G2(p)
+    return psi_clear_cofactor_G2(p)
 
 
 # --- G1 ---
@@ -0,0 +1,129 @@
+from collections.abc import (
+    Iterable,
+    Iterator,
+    Sequence,
+)
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    as_completed,
+)
+from types import (
+    TracebackType,
+)
+from typing import (
+    Any,
+)
+
+from py_ecc.optimized_bls12_381 import (
+    multiply_G1,
+    multiply_G2,
+)
+
+from .ciphersuites import (
+    BaseG2Ciphersuite,
+    G2ProofOfPossession,
+)
+
+VERIFY_METHODS = ("Verify", "AggregateVerify", "FastAggregateVerify")
+
+
+def _warm_up(ciphersuite: type[BaseG2Ciphersuite]) -> None:
+    """
+    Worker initializer: build the generator tables and run every code path of a
+    verification once, so that the first real job is not slower than the rest.
+    """
+    multiply_G1(1)
+    multiply_G2(1)
+    PK = ciphersuite.SkToPk(1)
+    ciphersuite.Verify(PK, b"", ciphersuite.Sign(1, b""))
+
+
+def _verify(
+    ciphersuite: type[BaseG2Ciphersuite], method: str, args: Sequence[Any]
+) -> bool:
+    return bool(getattr(ciphersuite, method)(*args))
+
+
+class ParallelVerifier:
+    """
+    Run `Verify`, `AggregateVerify` and `FastAggregateVerify` jobs of a
+    ciphersuite in a pool of worker processes. Jobs and results cross process
+    boundaries as their byte encodings and booleans only.
+
+    Use it as a context manager, or call `close` to shut the pool down. Its
+    `executor` can also be passed to `AggregateVerify` and `KeyValidateBatch`.
+    """
+
+    def __init__(
+        self,
+        ciphersuite: type[BaseG2Ciphersuite] = G2ProofOfPossession,
+        processes: int | None = None,
+    ) -> None:
+        self.ciphersuite = ciphersuite
+        self._executor = ProcessPoolExecutor(
+            max_workers=processes, initializer=_warm_up, initargs=(ciphersuite,)
+        )
+
+    @property
+    def executor(self) -> Executor:
+        """
+        The underlying pool of warmed-up worker processes.
+        """
+        return self._executor
+
+    def _check_method(self, method: str) -> None:
+        if method not in VERIFY_METHODS or not hasattr(self.ciphersuite, method):
+            raise ValueError(
+                f"{self.ciphersuite.__name__} has no verification method {method}"
+            )
+
+    def submit(self, method: str, *args: Any) -> Future[bool]:
+        """
+        Schedule a single job, e.g. `submit("Verify", PK, message, signature)`.
+        """
+        self._check_method(method)
+        return self._executor.submit(_verify, self.ciphersuite, method, args)
+
+    def map(
+        self, method: str, jobs: Iterable[Sequence[Any]], chunksize: int = 1
+    ) -> Iterator[bool]:
+        """
+        Run `method` on the arguments of every job. Results are yielded in the
+        order of `jobs`.
+        """
+        self._check_method(method)
+        jobs = list(jobs)
+        return self._executor.map(
+            _verify,
+            [self.ciphersuite] * len(jobs),
+            [method] * len(jobs),
+            jobs,
+            chunksize=chunksize,
+        )
+
+    def as_completed(
+        self, method: str, jobs: Iterable[Sequence[Any]]
+    ) -> Iterator[tuple[int, bool]]:
+        """
+        Run `method` on the arguments of every job, yielding (index, result)
+        pairs as soon as each job completes.
+        """
+        futures = {self.submit(method, *args): i for i, args in enumerate(jobs)}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+    def close(self) -> None:
+        self._executor.shutdown()
+
+    def __enter__(self) -> "ParallelVerifier":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
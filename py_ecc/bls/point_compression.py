@@ -1,3 +1,7 @@
+from collections.abc import (
+    Sequence,
+)
+
 from py_ecc.fields import (
     optimized_bls12_381_FQ as FQ,
     optimized_bls12_381_FQ2 as FQ2,
@@ -7,6 +11,7 @@ from py_ecc.optimized_bls12_381 import (
     Z2,
     b,
     b2,
+    batch_normalize,
     field_modulus as q,
     is_inf,
     is_on_curve,
@@ -66,10 +71,29 @@ def compress_G1(pt: G1Uncompressed) -> G1Compressed:
         return G1Compressed(POW_2_383 + POW_2_382)
     else:
         x, y = normalize(pt)
-        # Record y's leftmost bit to the a_flag
-        a_flag = (y.n * 2) // q
-        # Set c_flag = 1 and b_flag = 0
-        return G1Compressed(x.n + a_flag * POW_2_381 + POW_2_383)
+        return _compress_G1_affine(x, y)
+
+
+def _compress_G1_affine(x: FQ, y: FQ) -> G1Compressed:
+    # Record y's leftmost bit to the a_flag
+    a_flag = (y.n * 2) // q
+    # Set c_flag = 1 and b_flag = 0
+    return G1Compressed(x.n + a_flag * POW_2_381 + POW_2_383)
+
+
+def compress_G1_batch(pts: Sequence[G1Uncompressed]) -> list[G1Compressed]:
+    """
+    Compress several points with `compress_G1`, sharing a single field inversion
+    to normalize all of them.
+    """
+    return [
+        (
+            G1Compressed(POW_2_383 + POW_2_382)
+            if is_inf(pt)
+            else _compress_G1_affine(x, y)
+        )
+        for pt, (x, y) in zip(pts, batch_normalize(pts))
+    ]
 
 
 def decompress_G1(z: G1Compressed) -> G1Uncompressed:
@@ -112,6 +136,20 @@ def decompress_G1(z: G1Compressed) -> G1Uncompressed:
     return (FQ(x), FQ(y), FQ(1))
 
 
+def decompress_G1_batch(zs: Sequence[G1Compressed]) -> list[G1Uncompressed | None]:
+    """
+    Decompress several points with `decompress_G1`. Each result is the decoded
+    point, or None where `decompress_G1` rejects the encoding.
+    """
+    points: list[G1Uncompressed | None] = []
+    for z in zs:
+        try:
+            points.append(decompress_G1(z))
+        except ValueError:
+            points.append(None)
+    return points
+
+
 #
 # G2
 #
@@ -153,6 +191,10 @@ def compress_G2(pt: G2Uncompressed) -> G2Compressed:
     if is_inf(pt):
         return G2Compressed((POW_2_383 + POW_2_382, 0))
     x, y = normalize(pt)
+    return _compress_G2_affine(x, y)
+
+
+def _compress_G2_affine(x: FQ2, y: FQ2) -> G2Compressed:
     x_re, x_im = x.coeffs
     y_re, y_im = y.coeffs
     # Record the leftmost bit of y_im to the a_flag1
@@ -167,6 +209,24 @@ def compress_G2(pt: G2Uncompressed) -> G2Compressed:
     return G2Compressed((int(z1), int(z2)))
 
 
+def compress_G2_batch(pts: Sequence[G2Uncompressed]) -> list[G2Compressed]:
+    """
+    Compress several points with `compress_G2`, sharing a single field inversion
+    to normalize all of them.
+    """
+    for pt in pts:
+        if not is_on_curve(pt, b2):
+            raise ValueError("The given point is not on the twisted curve over FQ**2")
+    return [
+        (
+            G2Compressed((POW_2_383 + POW_2_382, 0))
+            if is_inf(pt)
+            else _compress_G2_affine(x, y)
+        )
+        for pt, (x, y) in zip(pts, batch_normalize(pts))
+    ]
+
+
 def decompress_G2(p: G2Compressed) -> G2Uncompressed:
     """
     Recovers x and y coordinates from the compressed point (z1, z2).
@@ -13,6 +13,11 @@ from .optimized_field_elements import (
     FQ12 as optimized_FQ12,
     FQP as optimized_FQP,
 )
+from .optimized_tower_field_elements import (
+    FQ2 as optimized_tower_FQ2,
+    FQ6 as optimized_tower_FQ6,
+    FQ12 as optimized_tower_FQ12,
+)
 
 
 #
@@ -63,39 +68,85 @@ class bls12_381_FQ12(FQ12, bls12_381_FQP):
 
 
 class optimized_bn128_FQ(optimized_FQ):
+    __slots__ = ()
     field_modulus = field_properties["bn128"]["field_modulus"]
 
 
 class optimized_bn128_FQP(optimized_FQP):
+    __slots__ = ()
     field_modulus = field_properties["bn128"]["field_modulus"]
 
 
 class optimized_bn128_FQ2(optimized_FQ2, optimized_bn128_FQP):
+    __slots__ = ()
     field_modulus = field_properties["bn128"]["field_modulus"]
     FQ2_MODULUS_COEFFS = field_properties["bn128"]["fq2_modulus_coeffs"]
 
 
 class optimized_bn128_FQ12(optimized_FQ12, optimized_bn128_FQP):
+    __slots__ = ()
     field_modulus = field_properties["bn128"]["field_modulus"]
     FQ12_MODULUS_COEFFS = field_properties["bn128"]["fq12_modulus_coeffs"]
 
 
+#
+# optimized_bn128 tower fields
+#
+class optimized_bn128_tower_FQ2(optimized_tower_FQ2):
+    field_modulus = field_properties["bn128"]["field_modulus"]
+    flat_type = optimized_bn128_FQ2
+
+
+class optimized_bn128_FQ6(optimized_tower_FQ6):
+    field_modulus = field_properties["bn128"]["field_modulus"]
+    FQ6_NON_RESIDUE = field_properties["bn128"]["fq6_non_residue"]
+
+
+class optimized_bn128_tower_FQ12(optimized_tower_FQ12):
+    field_modulus = field_properties["bn128"]["field_modulus"]
+    FQ6_NON_RESIDUE = field_properties["bn128"]["fq6_non_residue"]
+    flat_type = optimized_bn128_FQ12
+
+
 #
 # optimized_bls12_381 curve fields
 #
 class optimized_bls12_381_FQ(optimized_FQ):
+    __slots__ = ()
     field_modulus = field_properties["bls12_381"]["field_modulus"]
 
 
 class optimized_bls12_381_FQP(optimized_FQP):
+    __slots__ = ()
     field_modulus = field_properties["bls12_381"]["field_modulus"]
 
 
 class optimized_bls12_381_FQ2(optimized_FQ2, optimized_bls12_381_FQP):
+    __slots__ = ()
     field_modulus = field_properties["bls12_381"]["field_modulus"]
     FQ2_MODULUS_COEFFS = field_properties["bls12_381"]["fq2_modulus_coeffs"]
 
 
 class optimized_bls12_381_FQ12(optimized_FQ12, optimized_bls12_381_FQP):
+    __slots__ = ()
     field_modulus = field_properties["bls12_381"]["field_modulus"]
     FQ12_MODULUS_COEFFS = field_properties["bls12_381"]["fq12_modulus_coeffs"]
+
+
+#
+# optimized_bls12_381 tower fields
+#
+class optimized_bls12_381_tower_FQ2(optimized_tower_FQ2):
+    field_modulus = field_properties["bls12_381"]["field_modulus"]
+    flat_type = optimized_bls12_381_FQ2
+
+
+class optimized_bls12_381_FQ6(optimized_tower_FQ6):
+    field_modulus = field_properties["bls12_381"]["field_modulus"]
+    FQ6_NON_RESIDUE = field_properties["bls12_381"]["fq6_non_residue"]
+
+
+class optimized_bls12_381_tower_FQ12(optimized_tower_FQ12):
+    field_modulus = field_properties["bls12_381"]["field_modulus"]
+    FQ6_NON_RESIDUE = field_properties["bls12_381"]["fq6_non_residue"]
+    flat_type = optimized_bls12_381_FQ12
@@ -2,7 +2,6 @@ from collections.abc import (
     Sequence,
 )
 from functools import (
-    cached_property,
     total_ordering,
 )
 from typing import (
@@ -19,6 +18,9 @@ from py_ecc.utils import (
 )
 
 if TYPE_CHECKING:
+    from py_ecc.fields.optimized_tower_field_elements import (
+        FQ12 as TowerFQ12,
+    )
     from py_ecc.typing import (
         FQ2_modulus_coeffs_type,
         FQ12_modulus_coeffs_type,
@@ -50,6 +52,8 @@ class FQ:
     and it becomes a field element.
     """
 
+    __slots__ = ("n",)
+
     n: int
     field_modulus: int
 
@@ -66,6 +70,16 @@ class FQ:
                 f"Expected an int or FQ object, but got object of type {type(val)}"
             )
 
+    @classmethod
+    def _from_reduced(cls: type[T_FQ], n: int) -> T_FQ:
+        """
+        Trusted constructor for an integer already reduced modulo `field_modulus`,
+        skipping the validation and reduction of `__init__`.
+        """
+        element = object.__new__(cls)
+        element.n = n
+        return element
+
     def __add__(self: T_FQ, other: IntOrFQ) -> T_FQ:
         if isinstance(other, FQ):
             on = other.n
@@ -76,7 +90,7 @@ class FQ:
                 f"Expected an int or FQ object, but got object of type {type(other)}"
             )
 
-        return type(self)((self.n + on) % self.field_modulus)
+        return type(self)._from_reduced((self.n + on) % self.field_modulus)
 
     def __mul__(self: T_FQ, other: IntOrFQ) -> T_FQ:
         if isinstance(other, FQ):
@@ -88,7 +102,7 @@ class FQ:
                 f"Expected an int or FQ object, but got object of type {type(other)}"
             )
 
-        return type(self)((self.n * on) % self.field_modulus)
+        return type(self)._from_reduced((self.n * on) % self.field_modulus)
 
     def __rmul__(self: T_FQ, other: IntOrFQ) -> T_FQ:
         return self * other
@@ -106,7 +120,7 @@ class FQ:
                 f"Expected an int or FQ object, but got object of type {type(other)}"
             )
 
-        return type(self)((on - self.n) % self.field_modulus)
+        return type(self)._from_reduced((on - self.n) % self.field_modulus)
 
     def __sub__(self: T_FQ, other: IntOrFQ) -> T_FQ:
         if isinstance(other, FQ):
@@ -118,7 +132,7 @@ class FQ:
                 f"Expected an int or FQ object, but got object of type {type(other)}"
             )
 
-        return type(self)((self.n - on) % self.field_modulus)
+        return type(self)._from_reduced((self.n - on) % self.field_modulus)
 
     def __mod__(self: T_FQ, other: IntOrFQ) -> T_FQ:
         raise NotImplementedError("Modulo Operation not yet supported by fields")
@@ -133,7 +147,7 @@ class FQ:
                 f"Expected an int or FQ object, but got object of type {type(other)}"
             )
 
-        return type(self)(
+        return type(self)._from_reduced(
             self.n * prime_field_inv(on, self.field_modulus) % self.field_modulus
         )
 
@@ -150,7 +164,7 @@ class FQ:
                 f"Expected an int or FQ object, but got object of type {type(other)}"
             )
 
-        return type(self)(
+        return type(self)._from_reduced(
             prime_field_inv(self.n, self.field_modulus) * on % self.field_modulus
         )
 
@@ -181,7 +195,7 @@ class FQ:
         return not self == other
 
     def __neg__(self: T_FQ) -> T_FQ:
-        return type(self)(-self.n)
+        return type(self)._from_reduced(-self.n % self.field_modulus)
 
     def __repr__(self: T_FQ) -> str:
         return repr(self.n)
@@ -200,7 +214,7 @@ class FQ:
             )
         return self.n < on
 
-    @cached_property
+    @property
     def sgn0(self: T_FQ) -> int:
         """
         Calculates the sign of a value.
@@ -222,14 +236,41 @@ class FQ:
         return cls(0)
 
 
+# The field classes created by `FQP._with_modulus`
+_modulus_classes: dict[tuple[type["FQP"], tuple[IntOrFQ, ...]], type["FQP"]] = {}
+
+
 class FQP:
     """
     A class for elements in polynomial extension fields
     """
 
+    __slots__ = ("coeffs",)
+
+    coeffs: tuple[IntOrFQ, ...]
+    # The modulus data is shared by all the elements of a field, and set once per
+    # field class by `_set_modulus_coeffs`
+    # The coefficients of the modulus, without the leading [1]
+    modulus_coeffs: tuple[IntOrFQ, ...] = ()
+    # The degree of the extension field
     degree: int = 0
+    # The non-zero coefficients of the modulus with their indices
+    mc_tuples: list[tuple[int, int]] = []
+    # For every power k of the Frobenius map, the non-zero coefficients of
+    # x**(i * field_modulus**k) for each i, as computed by `_frobenius_table`
+    frobenius_tables: dict[int, list[list[tuple[int, int]]]] = {}
     field_modulus: int
-    mc_tuples: list[tuple[int, int]]
+
+    def __new__(
+        cls: type[T_FQP],
+        coeffs: Sequence[IntOrFQ],
+        modulus_coeffs: Sequence[IntOrFQ] = (),
+    ) -> T_FQP:
+        # A bare FQP built with explicit modulus_coeffs becomes an element of the
+        # field class of that modulus
+        if modulus_coeffs and not cls.modulus_coeffs:
+            cls = cls._with_modulus(tuple(modulus_coeffs))
+        return object.__new__(cls)
 
     def __init__(
         self, coeffs: Sequence[IntOrFQ], modulus_coeffs: Sequence[IntOrFQ] = ()
@@ -237,21 +278,80 @@ class FQP:
         if not hasattr(self, "field_modulus"):
             raise AttributeError("Field Modulus hasn't been specified")
 
-        if len(coeffs) != len(modulus_coeffs):
+        if len(coeffs) != len(modulus_coeffs or self.modulus_coeffs):
             raise Exception("coeffs and modulus_coeffs aren't of the same length")
 
         # Not converting coeffs to FQ or explicitly making them integers
         # for performance reasons
         if isinstance(coeffs[0], int):
-            self.coeffs: tuple[IntOrFQ, ...] = tuple(
-                coeff % self.field_modulus for coeff in coeffs
-            )
+            self.coeffs = tuple(coeff % self.field_modulus for coeff in coeffs)
         else:
             self.coeffs = tuple(coeffs)
-        # The coefficients of the modulus, without the leading [1]
-        self.modulus_coeffs: tuple[IntOrFQ, ...] = tuple(modulus_coeffs)
-        # The degree of the extension field
-        self.degree = len(self.modulus_coeffs)
+
+    @classmethod
+    def _set_modulus_coeffs(cls, modulus_coeffs: Sequence[IntOrFQ]) -> None:
+        cls.modulus_coeffs = tuple(modulus_coeffs)
+        cls.degree = len(modulus_coeffs)
+        cls.mc_tuples = [(i, int(c)) for i, c in enumerate(modulus_coeffs) if c]
+        cls.frobenius_tables = {}
+
+    @classmethod
+    def _with_modulus(
+        cls: type[T_FQP], modulus_coeffs: tuple[IntOrFQ, ...]
+    ) -> type[T_FQP]:
+        """
+        The subclass of a field class without a modulus for the given modulus,
+        created on first use.
+        """
+        key = (cls, modulus_coeffs)
+        if key not in _modulus_classes:
+            field_class: type[T_FQP] = type(cls.__name__, (cls,), {"__slots__": ()})
+            field_class._set_modulus_coeffs(modulus_coeffs)
+            _modulus_classes[key] = field_class
+        return cast(type[T_FQP], _modulus_classes[key])
+
+    @classmethod
+    def _from_reduced(cls: type[T_FQP], coeffs: tuple[IntOrFQ, ...]) -> T_FQP:
+        """
+        Trusted constructor for coefficients already reduced modulo
+        `field_modulus`, skipping the validation and reduction of `__init__`.
+        """
+        element = object.__new__(cls)
+        element.coeffs = coeffs
+        return element
+
+    @classmethod
+    def _from_unreduced(cls: type[T_FQP], coeffs: tuple[int, ...]) -> T_FQP:
+        """
+        Constructor for the elements of lazy reduction, whose coefficients are
+        arbitrary integers until `reduce` is called.
+        """
+        element = object.__new__(cls)
+        element.coeffs = coeffs
+        return element
+
+    #
+    # Lazy reduction
+    #
+    # The *_unreduced methods skip the reduction modulo `field_modulus` and leave
+    # the coefficients as arbitrary, possibly negative, integers. Such elements can
+    # be passed to further *_unreduced calls, and to `*` and `square`, which
+    # reduce their result anyway. Any other use, such as `==`, needs `reduce` first.
+    #
+    def add_unreduced(self: T_FQP, other: T_FQP) -> T_FQP:
+        return type(self)._from_unreduced(
+            tuple(int(x) + int(y) for x, y in zip(self.coeffs, other.coeffs))
+        )
+
+    def sub_unreduced(self: T_FQP, other: T_FQP) -> T_FQP:
+        return type(self)._from_unreduced(
+            tuple(int(x) - int(y) for x, y in zip(self.coeffs, other.coeffs))
+        )
+
+    def reduce(self: T_FQP) -> T_FQP:
+        return type(self)._from_reduced(
+            tuple(int(c) % self.field_modulus for c in self.coeffs)
+        )
 
     def __add__(self: T_FQP, other: T_FQP) -> T_FQP:
         if not isinstance(other, type(self)):
@@ -259,8 +359,11 @@ class FQP:
                 f"Expected an FQP object, but got object of type {type(other)}"
             )
 
-        return type(self)(
-            [int(x + y) % self.field_modulus for x, y in zip(self.coeffs, other.coeffs)]
+        return type(self)._from_reduced(
+            tuple(
+                int(x + y) % self.field_modulus
+                for x, y in zip(self.coeffs, other.coeffs)
+            )
         )
 
     def __sub__(self: T_FQP, other: T_FQP) -> T_FQP:
@@ -269,8 +372,11 @@ class FQP:
                 f"Expected an FQP object, but got object of type {type(other)}"
             )
 
-        return type(self)(
-            [int(x - y) % self.field_modulus for x, y in zip(self.coeffs, other.coeffs)]
+        return type(self)._from_reduced(
+            tuple(
+                int(x - y) % self.field_modulus
+                for x, y in zip(self.coeffs, other.coeffs)
+            )
         )
 
     def __mod__(self: T_FQP, other: int | T_FQP) -> T_FQP:
@@ -278,8 +384,8 @@ class FQP:
 
     def __mul__(self: T_FQP, other: int | T_FQP) -> T_FQP:
         if isinstance(other, int):
-            return type(self)(
-                [int(c) * other % self.field_modulus for c in self.coeffs]
+            return type(self)._from_reduced(
+                tuple(int(c) * other % self.field_modulus for c in self.coeffs)
             )
         elif isinstance(other, FQP):
             b = [0] * (self.degree * 2 - 1)
@@ -287,12 +393,7 @@ class FQP:
             for i, eli in enumerate(self.coeffs):
                 for j, elj in inner_enumerate:
                     b[i + j] += int(eli * elj)
-            # MID = len(self.coeffs) // 2
-            for exp in range(self.degree - 2, -1, -1):
-                top = b.pop()
-                for i, c in self.mc_tuples:
-                    b[exp + i] -= top * c
-            return type(self)([x % self.field_modulus for x in b])
+            return self._reduce(b)
         else:
             raise TypeError(
                 f"Expected an int or FQP object, but got object of type {type(other)}"
@@ -301,6 +402,32 @@ class FQP:
     def __rmul__(self: T_FQP, other: int | T_FQP) -> T_FQP:
         return self * other
 
+    def _reduce(self: T_FQP, b: list[int]) -> T_FQP:
+        """
+        The element represented by the product polynomial `b`, of degree
+        2 * (degree - 1), reduced by the modulus polynomial. `b` is consumed.
+        """
+        for exp in range(self.degree - 2, -1, -1):
+            top = b.pop()
+            for i, c in self.mc_tuples:
+                b[exp + i] -= top * c
+        return type(self)._from_reduced(tuple(x % self.field_modulus for x in b))
+
+    def square(self: T_FQP) -> T_FQP:
+        """
+        Schoolbook squaring computing each cross product a_i * a_j once.
+        """
+        a = [int(c) for c in self.coeffs]
+        b = [0] * (self.degree * 2 - 1)
+        for i, ai in enumerate(a):
+            if not ai:
+                continue
+            b[2 * i] += ai * ai
+            ai2 = ai * 2
+            for j in range(i + 1, self.degree):
+                b[i + j] += ai2 * a[j]
+        return self._reduce(b)
+
     def __div__(self: T_FQP, other: int | T_FQP) -> T_FQP:
         if isinstance(other, int):
             return type(self)(
@@ -328,9 +455,41 @@ class FQP:
             if other & 1:
                 o = o * t
             other >>= 1
-            t = t * t
+            t = t.square()
         return o
 
+    @classmethod
+    def _frobenius_table(cls, k: int) -> list[list[tuple[int, int]]]:
+        if k not in cls.frobenius_tables:
+            if k == 1:
+                x_p = cls([0, 1] + [0] * (cls.degree - 2)) ** cls.field_modulus
+            else:
+                x_p = cls([0, 1] + [0] * (cls.degree - 2)).frobenius(k - 1).frobenius()
+            table = []
+            x_ip = cls.one()
+            for _ in range(cls.degree):
+                table.append([(j, int(c)) for j, c in enumerate(x_ip.coeffs) if c])
+                x_ip *= x_p
+            cls.frobenius_tables[k] = table
+        return cls.frobenius_tables[k]
+
+    def frobenius(self: T_FQP, k: int = 1) -> T_FQP:
+        """
+        self ** (field_modulus ** k). The map is linear over the base field, so
+        it only takes the products of the coefficients by the sparse constants
+        x**(i * field_modulus**k), which are computed once per field and k.
+        """
+        k %= self.degree
+        if k == 0:
+            return self
+        b = [0] * self.degree
+        for a_i, row in zip(self.coeffs, self._frobenius_table(k)):
+            if a_i:
+                a_i = int(a_i)
+                for j, c in row:
+                    b[j] += a_i * c
+        return type(self)._from_reduced(tuple(x % self.field_modulus for x in b))
+
     def optimized_poly_rounded_div(
         self, a: Sequence[IntOrFQ], b: Sequence[IntOrFQ]
     ) -> Sequence[IntOrFQ]:
@@ -387,9 +546,11 @@ class FQP:
         return not self == other
 
     def __neg__(self: T_FQP) -> T_FQP:
-        return type(self)([-c for c in self.coeffs])
+        return type(self)._from_reduced(
+            tuple(-int(c) % self.field_modulus for c in self.coeffs)
+        )
 
-    @cached_property
+    @property
     def sgn0(self: T_FQP) -> int:
         """
         Calculates the sign of a value.
@@ -421,17 +582,86 @@ class FQ2(FQP):
     The quadratic extension field
     """
 
-    degree: int = 2
+    __slots__ = ()
+
+    degree = 2
     FQ2_MODULUS_COEFFS: "FQ2_modulus_coeffs_type"
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if hasattr(cls, "FQ2_MODULUS_COEFFS"):
+            cls._set_modulus_coeffs(cls.FQ2_MODULUS_COEFFS)
+
     def __init__(self, coeffs: Sequence[IntOrFQ]) -> None:
         if not hasattr(self, "FQ2_MODULUS_COEFFS"):
             raise AttributeError("FQ2 Modulus Coeffs haven't been specified")
 
-        self.mc_tuples = [(i, c) for i, c in enumerate(self.FQ2_MODULUS_COEFFS) if c]
-        super().__init__(coeffs, self.FQ2_MODULUS_COEFFS)
+        super().__init__(coeffs)
+
+    # With u**2 == -m0 (the modulus u**2 + m1 * u + m0 of both curves has m1 == 0),
+    # Karatsuba multiplication takes three products of integers instead of four
+    def __mul__(self: T_FQ2, other: int | T_FQ2) -> T_FQ2:
+        m0, m1 = self.FQ2_MODULUS_COEFFS
+        if not isinstance(other, FQ2) or m1:
+            return super().__mul__(other)
+        a0, a1 = self.coeffs
+        b0, b1 = other.coeffs
+        a0, a1, b0, b1 = int(a0), int(a1), int(b0), int(b1)
+        t0 = a0 * b0
+        t1 = a1 * b1
+        return type(self)._from_reduced(
+            (
+                (t0 - m0 * t1) % self.field_modulus,
+                ((a0 + a1) * (b0 + b1) - t0 - t1) % self.field_modulus,
+            )
+        )
+
+    def add_unreduced(self: T_FQ2, other: T_FQ2) -> T_FQ2:
+        a0, a1 = self.coeffs
+        b0, b1 = other.coeffs
+        return type(self)._from_unreduced((int(a0) + int(b0), int(a1) + int(b1)))
 
-    @cached_property
+    def sub_unreduced(self: T_FQ2, other: T_FQ2) -> T_FQ2:
+        a0, a1 = self.coeffs
+        b0, b1 = other.coeffs
+        return type(self)._from_unreduced((int(a0) - int(b0), int(a1) - int(b1)))
+
+    def reduce(self: T_FQ2) -> T_FQ2:
+        a0, a1 = self.coeffs
+        return type(self)._from_reduced(
+            (int(a0) % self.field_modulus, int(a1) % self.field_modulus)
+        )
+
+    # 1 / (a0 + a1 * u) = (a0 - a1 * u) / (a0**2 + m0 * a1**2), with a single
+    # inversion in FQ. Like the generic `inv`, maps zero to zero
+    def inv(self: T_FQ2) -> T_FQ2:
+        m0, m1 = self.FQ2_MODULUS_COEFFS
+        if m1:
+            return super().inv()
+        a0, a1 = self.coeffs
+        a0, a1 = int(a0), int(a1)
+        q = self.field_modulus
+        n = (a0 * a0 + m0 * a1 * a1) % q
+        if n:
+            n = pow(n, -1, q)
+        return type(self)._from_reduced((a0 * n % q, -a1 * n % q))
+
+    # Complex squaring: (a0 + a1 * u)**2 takes two products of integers
+    def square(self: T_FQ2) -> T_FQ2:
+        m0, m1 = self.FQ2_MODULUS_COEFFS
+        if m1:
+            return super().square()
+        a0, a1 = self.coeffs
+        a0, a1 = int(a0), int(a1)
+        v = a0 * a1
+        return type(self)._from_reduced(
+            (
+                ((a0 + a1) * (a0 - m0 * a1) + (m0 - 1) * v) % self.field_modulus,
+                (v * 2) % self.field_modulus,
+            )
+        )
+
+    @property
     def sgn0(self: T_FQP) -> int:
         """
         Calculates the sign of a value.
@@ -454,12 +684,84 @@ class FQ12(FQP):
     The 12th-degree extension field
     """
 
-    degree: int = 12
+    __slots__ = ()
+
+    degree = 12
     FQ12_MODULUS_COEFFS: "FQ12_modulus_coeffs_type"
+    # The tower FQ12 class representing the same field, set by that class
+    tower_type: type["TowerFQ12"]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if hasattr(cls, "FQ12_MODULUS_COEFFS"):
+            cls._set_modulus_coeffs(cls.FQ12_MODULUS_COEFFS)
 
     def __init__(self, coeffs: Sequence[IntOrFQ]) -> None:
         if not hasattr(self, "FQ12_MODULUS_COEFFS"):
             raise AttributeError("FQ12 Modulus Coeffs haven't been specified")
 
-        self.mc_tuples = [(i, c) for i, c in enumerate(self.FQ12_MODULUS_COEFFS) if c]
-        super().__init__(coeffs, self.FQ12_MODULUS_COEFFS)
+        super().__init__(coeffs)
+
+    # One level of Karatsuba: with a = a_lo + a_hi * w**6 and likewise for b, the
+    # product takes three 6 x 6 schoolbook products instead of four
+    def __mul__(self: T_FQ12, other: int | T_FQ12) -> T_FQ12:
+        if not isinstance(other, FQ12):
+            return super().__mul__(other)
+        a = [int(c) for c in self.coeffs]
+        b = [int(c) for c in other.coeffs]
+        lo = _schoolbook_6(a[:6], b[:6])
+        hi = _schoolbook_6(a[6:], b[6:])
+        mid = _schoolbook_6(
+            [x + y for x, y in zip(a[:6], a[6:])], [x + y for x, y in zip(b[:6], b[6:])]
+        )
+        c = lo + [0] + hi
+        for i in range(11):
+            c[i + 6] += mid[i] - lo[i] - hi[i]
+        return self._reduce(c)
+
+    # Invert in the tower FQ12 -> FQ6 -> FQ2 -> FQ, taking norms down to a single
+    # inversion in FQ. Like the generic `inv`, maps zero to zero
+    def inv(self: T_FQ12) -> T_FQ12:
+        if not hasattr(self, "tower_type"):
+            return super().inv()
+        return cast(T_FQ12, self.tower_type.from_fqp(self).inv().to_fqp())
+
+
+def _schoolbook_6(a: list[int], b: list[int]) -> list[int]:
+    """
+    The 11 coefficients of the product of two polynomials with 6 coefficients.
+    """
+    c = [0] * 11
+    for i, ai in enumerate(a):
+        if ai:
+            for j, bj in enumerate(b):
+                c[i + j] += ai * bj
+    return c
+
+
+def batch_inv(elements: Sequence[T_FQP]) -> list[T_FQP]:
+    """
+    The inverses of several elements of the same field, at the cost of a single
+    `inv` and three multiplications per element (Montgomery's simultaneous
+    inversion). Like `inv`, maps zero to zero.
+    """
+    if not elements:
+        return []
+    one, zero = elements[0].one(), elements[0].zero()
+    # prefixes[i] is the product of the non-zero elements[:i]
+    prefixes = []
+    product = one
+    for x in elements:
+        prefixes.append(product)
+        if x != zero:
+            product = product * x
+    inv = product.inv()
+    inverses = list(elements)
+    for i in range(len(elements) - 1, -1, -1):
+        x = elements[i]
+        if x == zero:
+            continue
+        # inv is the inverse of the product of the non-zero elements[:i + 1]
+        inverses[i] = inv * prefixes[i]
+        inv = inv * x
+    return inverses
@@ -0,0 +1,532 @@
+from collections.abc import (
+    Sequence,
+)
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    TypeVar,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from py_ecc.fields.optimized_field_elements import (
+        FQ2 as FlatFQ2,
+        FQ12 as FlatFQ12,
+    )
+
+
+# These new TypeVars are needed because these classes are kind of base classes and
+# we need the output type to correspond to the type of the inherited class
+T_FQ2 = TypeVar("T_FQ2", bound="FQ2")
+T_FQ6 = TypeVar("T_FQ6", bound="FQ6")
+T_FQ12 = TypeVar("T_FQ12", bound="FQ12")
+
+
+#
+# The tower is built as
+#   FQ2  = FQ[i] / (i**2 + 1)
+#   FQ6  = FQ2[v] / (v**3 - xi),  xi = xi0 + i
+#   FQ12 = FQ6[w] / (w**2 - v)
+# and every element stores its coefficients over FQ as a flat tuple of ints:
+# (c0, c1) for FQ2, the three FQ2 coefficients for FQ6 and the two FQ6
+# coefficients for FQ12.
+#
+# The helpers below work on plain ints and leave their results unreduced, so that
+# the callers only pay for a modular reduction once per output coefficient.
+#
+# Karatsuba multiplication: 3 products instead of 4
+def _fq2_mul(a0: int, a1: int, b0: int, b1: int) -> tuple[int, int]:
+    t0 = a0 * b0
+    t1 = a1 * b1
+    return t0 - t1, (a0 + a1) * (b0 + b1) - t0 - t1
+
+
+def _fq2_mul_by_xi(a0: int, a1: int, xi0: int) -> tuple[int, int]:
+    return a0 * xi0 - a1, a0 + a1 * xi0
+
+
+def _fq6_mul(a: Sequence[int], b: Sequence[int], xi0: int) -> list[int]:
+    a00, a01, a10, a11, a20, a21 = a
+    b00, b01, b10, b11, b20, b21 = b
+    t00, t01 = _fq2_mul(a00, a01, b00, b01)
+    t10, t11 = _fq2_mul(a10, a11, b10, b11)
+    t20, t21 = _fq2_mul(a20, a21, b20, b21)
+    # c0 = t0 + xi * ((a1 + a2) * (b1 + b2) - t1 - t2)
+    x0, x1 = _fq2_mul(a10 + a20, a11 + a21, b10 + b20, b11 + b21)
+    x0, x1 = _fq2_mul_by_xi(x0 - t10 - t20, x1 - t11 - t21, xi0)
+    # c1 = (a0 + a1) * (b0 + b1) - t0 - t1 + xi * t2
+    y0, y1 = _fq2_mul(a00 + a10, a01 + a11, b00 + b10, b01 + b11)
+    z0, z1 = _fq2_mul_by_xi(t20, t21, xi0)
+    # c2 = (a0 + a2) * (b0 + b2) - t0 - t2 + t1
+    s0, s1 = _fq2_mul(a00 + a20, a01 + a21, b00 + b20, b01 + b21)
+    return [
+        t00 + x0,
+        t01 + x1,
+        y0 - t00 - t10 + z0,
+        y1 - t01 - t11 + z1,
+        s0 - t00 - t20 + t10,
+        s1 - t01 - t21 + t11,
+    ]
+
+
+def _fq6_mul_by_v(a: Sequence[int], xi0: int) -> list[int]:
+    # (a0 + a1 * v + a2 * v**2) * v = xi * a2 + a0 * v + a1 * v**2
+    return [*_fq2_mul_by_xi(a[4], a[5], xi0), a[0], a[1], a[2], a[3]]
+
+
+def _fq6_inv(a: Sequence[int], q: int, xi0: int) -> list[int]:
+    a00, a01, a10, a11, a20, a21 = a
+    # c0 = a0**2 - xi * a1 * a2
+    t0, t1 = _fq2_mul(a00, a01, a00, a01)
+    s0, s1 = _fq2_mul_by_xi(*_fq2_mul(a10, a11, a20, a21), xi0)
+    c00, c01 = (t0 - s0) % q, (t1 - s1) % q
+    # c1 = xi * a2**2 - a0 * a1
+    t0, t1 = _fq2_mul_by_xi(*_fq2_mul(a20, a21, a20, a21), xi0)
+    s0, s1 = _fq2_mul(a00, a01, a10, a11)
+    c10, c11 = (t0 - s0) % q, (t1 - s1) % q
+    # c2 = a1**2 - a0 * a2
+    t0, t1 = _fq2_mul(a10, a11, a10, a11)
+    s0, s1 = _fq2_mul(a00, a01, a20, a21)
+    c20, c21 = (t0 - s0) % q, (t1 - s1) % q
+    # norm = a0 * c0 + xi * (a2 * c1 + a1 * c2), an element of FQ2
+    t0, t1 = _fq2_mul(a20, a21, c10, c11)
+    s0, s1 = _fq2_mul(a10, a11, c20, c21)
+    t0, t1 = _fq2_mul_by_xi(t0 + s0, t1 + s1, xi0)
+    s0, s1 = _fq2_mul(a00, a01, c00, c01)
+    n0, n1 = _fq2_inv((t0 + s0) % q, (t1 + s1) % q, q)
+    return [
+        x % q
+        for x in (
+            *_fq2_mul(c00, c01, n0, n1),
+            *_fq2_mul(c10, c11, n0, n1),
+            *_fq2_mul(c20, c21, n0, n1),
+        )
+    ]
+
+
+# The power of w held by each FQ2 coefficient of an FQ12 element:
+# v**0, v**1, v**2, w, v * w, v**2 * w
+_W_POWERS = (0, 2, 4, 1, 3, 5)
+
+
+def _fq2_inv(a0: int, a1: int, q: int) -> tuple[int, int]:
+    # 1 / (a0 + a1 * i) = (a0 - a1 * i) / (a0**2 + a1**2)
+    n = pow(a0 * a0 + a1 * a1, -1, q)
+    return a0 * n % q, -a1 * n % q
+
+
+class FQ2:
+    """
+    The quadratic extension field FQ[i] / (i**2 + 1), the base of the tower.
+    Uses Karatsuba multiplication and the complex squaring method.
+    """
+
+    degree: int = 2
+    field_modulus: int
+    # The flat optimized FQ2 class sharing this field's coefficients
+    flat_type: type["FlatFQ2"]
+
+    def __init__(self, coeffs: Sequence[int]) -> None:
+        if not hasattr(self, "field_modulus"):
+            raise AttributeError("Field Modulus hasn't been specified")
+        if len(coeffs) != self.degree:
+            raise Exception(f"Expected {self.degree} coefficients, got {len(coeffs)}")
+
+        q = self.field_modulus
+        self.coeffs: tuple[int, ...] = tuple(c % q for c in coeffs)
+
+    @classmethod
+    def from_fqp(cls: type[T_FQ2], x: "FlatFQ2") -> T_FQ2:
+        return cls([int(c) for c in x.coeffs])
+
+    def to_fqp(self) -> "FlatFQ2":
+        return self.flat_type(list(self.coeffs))
+
+    def __add__(self: T_FQ2, other: T_FQ2) -> T_FQ2:
+        return type(self)([x + y for x, y in zip(self.coeffs, other.coeffs)])
+
+    def __sub__(self: T_FQ2, other: T_FQ2) -> T_FQ2:
+        return type(self)([x - y for x, y in zip(self.coeffs, other.coeffs)])
+
+    def __neg__(self: T_FQ2) -> T_FQ2:
+        return type(self)([-x for x in self.coeffs])
+
+    def __mul__(self: T_FQ2, other: Union[int, T_FQ2]) -> T_FQ2:
+        if isinstance(other, int):
+            return type(self)([x * other for x in self.coeffs])
+        elif isinstance(other, FQ2):
+            return type(self)(_fq2_mul(*self.coeffs, *other.coeffs))
+        else:
+            raise TypeError(
+                f"Expected an int or FQ2 object, but got object of type {type(other)}"
+            )
+
+    def __rmul__(self: T_FQ2, other: int) -> T_FQ2:
+        return self * other
+
+    def square(self: T_FQ2) -> T_FQ2:
+        # (a0 + a1 * i)**2 = (a0 + a1) * (a0 - a1) + 2 * a0 * a1 * i
+        a0, a1 = self.coeffs
+        return type(self)([(a0 + a1) * (a0 - a1), 2 * a0 * a1])
+
+    # Like the flat fields, maps zero to zero
+    def inv(self: T_FQ2) -> T_FQ2:
+        a0, a1 = self.coeffs
+        if a0 == a1 == 0:
+            return self
+        return type(self)(_fq2_inv(a0, a1, self.field_modulus))
+
+    def __truediv__(self: T_FQ2, other: T_FQ2) -> T_FQ2:
+        return self * other.inv()
+
+    def __pow__(self: T_FQ2, other: int) -> T_FQ2:
+        o = self.one()
+        for bit in bin(other)[2:]:
+            o = o.square()
+            if bit == "1":
+                o = o * self
+        return o
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, type(self)):
+            raise TypeError(
+                f"Expected an FQ2 object, but got object of type {type(other)}"
+            )
+        return self.coeffs == other.coeffs
+
+    def __ne__(self, other: Any) -> bool:
+        return not self == other
+
+    def __repr__(self) -> str:
+        return repr(self.coeffs)
+
+    @classmethod
+    def one(cls: type[T_FQ2]) -> T_FQ2:
+        return cls([1, 0])
+
+    @classmethod
+    def zero(cls: type[T_FQ2]) -> T_FQ2:
+        return cls([0, 0])
+
+
+class FQ6:
+    """
+    The sextic extension field FQ2[v] / (v**3 - xi)
+    """
+
+    degree: int = 6
+    field_modulus: int
+    # xi = FQ6_NON_RESIDUE[0] + FQ6_NON_RESIDUE[1] * i, with FQ6_NON_RESIDUE[1] == 1
+    FQ6_NON_RESIDUE: tuple[int, int]
+
+    def __init__(self, coeffs: Sequence[int]) -> None:
+        if not hasattr(self, "field_modulus"):
+            raise AttributeError("Field Modulus hasn't been specified")
+        if not hasattr(self, "FQ6_NON_RESIDUE"):
+            raise AttributeError("FQ6 Non Residue hasn't been specified")
+        if len(coeffs) != self.degree:
+            raise Exception(f"Expected {self.degree} coefficients, got {len(coeffs)}")
+
+        q = self.field_modulus
+        self.coeffs: tuple[int, ...] = tuple(c % q for c in coeffs)
+
+    def __add__(self: T_FQ6, other: T_FQ6) -> T_FQ6:
+        return type(self)([x + y for x, y in zip(self.coeffs, other.coeffs)])
+
+    def __sub__(self: T_FQ6, other: T_FQ6) -> T_FQ6:
+        return type(self)([x - y for x, y in zip(self.coeffs, other.coeffs)])
+
+    def __neg__(self: T_FQ6) -> T_FQ6:
+        return type(self)([-x for x in self.coeffs])
+
+    def __mul__(self: T_FQ6, other: Union[int, T_FQ6]) -> T_FQ6:
+        if isinstance(other, int):
+            return type(self)([x * other for x in self.coeffs])
+        elif isinstance(other, FQ6):
+            return type(self)(
+                _fq6_mul(self.coeffs, other.coeffs, self.FQ6_NON_RESIDUE[0])
+            )
+        else:
+            raise TypeError(
+                f"Expected an int or FQ6 object, but got object of type {type(other)}"
+            )
+
+    def __rmul__(self: T_FQ6, other: int) -> T_FQ6:
+        return self * other
+
+    def mul_by_v(self: T_FQ6) -> T_FQ6:
+        return type(self)(_fq6_mul_by_v(self.coeffs, self.FQ6_NON_RESIDUE[0]))
+
+    # Like the flat fields, maps zero to zero
+    def inv(self: T_FQ6) -> T_FQ6:
+        if not any(self.coeffs):
+            return self
+        return type(self)(
+            _fq6_inv(self.coeffs, self.field_modulus, self.FQ6_NON_RESIDUE[0])
+        )
+
+    def __truediv__(self: T_FQ6, other: T_FQ6) -> T_FQ6:
+        return self * other.inv()
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, type(self)):
+            raise TypeError(
+                f"Expected an FQ6 object, but got object of type {type(other)}"
+            )
+        return self.coeffs == other.coeffs
+
+    def __ne__(self, other: Any) -> bool:
+        return not self == other
+
+    def __repr__(self) -> str:
+        return repr(self.coeffs)
+
+    @classmethod
+    def one(cls: type[T_FQ6]) -> T_FQ6:
+        return cls([1] + [0] * 5)
+
+    @classmethod
+    def zero(cls: type[T_FQ6]) -> T_FQ6:
+        return cls([0] * 6)
+
+
+class FQ12:
+    """
+    The 12th-degree extension field FQ6[w] / (w**2 - v)
+
+    The flat optimized FQ12 is FQ[w] / (w**12 + c6 * w**6 + c0), with
+    w**6 = xi; both use the same w, so converting between them only
+    regroups coefficients.
+    """
+
+    degree: int = 12
+    field_modulus: int
+    FQ6_NON_RESIDUE: tuple[int, int]
+    # The flat optimized FQ12 class representing the same field
+    flat_type: type["FlatFQ12"]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Let the flat class invert its elements through this one
+        if "flat_type" in cls.__dict__:
+            cls.flat_type.tower_type = cls
+
+    def __init__(self, coeffs: Sequence[int]) -> None:
+        if not hasattr(self, "field_modulus"):
+            raise AttributeError("Field Modulus hasn't been specified")
+        if not hasattr(self, "FQ6_NON_RESIDUE"):
+            raise AttributeError("FQ6 Non Residue hasn't been specified")
+        if len(coeffs) != self.degree:
+            raise Exception(f"Expected {self.degree} coefficients, got {len(coeffs)}")
+
+        q = self.field_modulus
+        self.coeffs: tuple[int, ...] = tuple(c % q for c in coeffs)
+
+    @classmethod
+    def from_fqp(cls: type[T_FQ12], x: "FlatFQ12") -> T_FQ12:
+        """
+        Convert from the flat basis w**0, ..., w**11. The FQ2 coefficient of w**k
+        (k < 6) is c[k] + xi * c[k + 6] = (c[k] + xi0 * c[k + 6]) + c[k + 6] * i,
+        and w**k is v**(k // 2) * w**(k % 2) in the tower.
+        """
+        xi0 = cls.FQ6_NON_RESIDUE[0]
+        c = [int(coeff) for coeff in x.coeffs]
+        coeffs = []
+        for k in _W_POWERS:
+            coeffs += [c[k] + xi0 * c[k + 6], c[k + 6]]
+        return cls(coeffs)
+
+    def to_fqp(self) -> "FlatFQ12":
+        xi0 = self.FQ6_NON_RESIDUE[0]
+        c = [0] * 12
+        for j, k in enumerate(_W_POWERS):
+            re, im = self.coeffs[2 * j], self.coeffs[2 * j + 1]
+            c[k], c[k + 6] = re - xi0 * im, im
+        return self.flat_type(c)
+
+    def __add__(self: T_FQ12, other: T_FQ12) -> T_FQ12:
+        return type(self)([x + y for x, y in zip(self.coeffs, other.coeffs)])
+
+    def __sub__(self: T_FQ12, other: T_FQ12) -> T_FQ12:
+        return type(self)([x - y for x, y in zip(self.coeffs, other.coeffs)])
+
+    def __neg__(self: T_FQ12) -> T_FQ12:
+        return type(self)([-x for x in self.coeffs])
+
+    def __mul__(self: T_FQ12, other: Union[int, T_FQ12]) -> T_FQ12:
+        if isinstance(other, int):
+            return type(self)([x * other for x in self.coeffs])
+        elif not isinstance(other, FQ12):
+            raise TypeError(
+                f"Expected an int or FQ12 object, but got object of type {type(other)}"
+            )
+        xi0 = self.FQ6_NON_RESIDUE[0]
+        a0, a1 = self.coeffs[:6], self.coeffs[6:]
+        b0, b1 = other.coeffs[:6], other.coeffs[6:]
+        # Karatsuba over FQ6: 3 FQ6 multiplications
+        t0 = _fq6_mul(a0, b0, xi0)
+        t1 = _fq6_mul(a1, b1, xi0)
+        t2 = _fq6_mul(
+            [x + y for x, y in zip(a0, a1)], [x + y for x, y in zip(b0, b1)], xi0
+        )
+        c0 = [x + y for x, y in zip(t0, _fq6_mul_by_v(t1, xi0))]
+        c1 = [x - y - z for x, y, z in zip(t2, t0, t1)]
+        return type(self)(c0 + c1)
+
+    def __rmul__(self: T_FQ12, other: int) -> T_FQ12:
+        return self * other
+
+    def mul_by_sparse(self: T_FQ12, other: T_FQ12) -> T_FQ12:
+        """
+        Multiply by an element with few non-zero FQ2 coefficients, such as the
+        evaluation of a line function in the Miller loop. Schoolbook
+        multiplication over FQ2[w] / (w**6 - xi) that skips the zero coefficients
+        of ``other``: 6 FQ2 multiplications per non-zero coefficient, against 18
+        for a dense multiplication.
+        """
+        xi0 = self.FQ6_NON_RESIDUE[0]
+        a = [(0, 0, 0)] * 6
+        b = [(0, 0)] * 6
+        for j, k in enumerate(_W_POWERS):
+            a0, a1 = self.coeffs[2 * j], self.coeffs[2 * j + 1]
+            a[k] = a0, a1, a0 + a1
+            b[k] = other.coeffs[2 * j], other.coeffs[2 * j + 1]
+        # Unreduced coefficients of w**0, ..., w**10
+        c0 = [0] * 11
+        c1 = [0] * 11
+        for kb, (b0, b1) in enumerate(b):
+            if b0 == b1 == 0:
+                continue
+            bs = b0 + b1
+            for k, (a0, a1, as_) in enumerate(a, kb):
+                # Karatsuba, as in _fq2_mul
+                t0 = a0 * b0
+                t1 = a1 * b1
+                c0[k] += t0 - t1
+                c1[k] += as_ * bs - t0 - t1
+        # w**6 = xi
+        coeffs = []
+        for k in _W_POWERS:
+            if k < 5:
+                t0, t1 = _fq2_mul_by_xi(c0[k + 6], c1[k + 6], xi0)
+                coeffs += [c0[k] + t0, c1[k] + t1]
+            else:
+                coeffs += [c0[k], c1[k]]
+        return type(self)(coeffs)
+
+    def square(self: T_FQ12) -> T_FQ12:
+        # Complex squaring: 2 FQ6 multiplications
+        # (a0 + a1 * w)**2 = (a0 + a1) * (a0 + v * a1) - (1 + v) * a0 * a1
+        #                    + 2 * a0 * a1 * w
+        xi0 = self.FQ6_NON_RESIDUE[0]
+        a0, a1 = self.coeffs[:6], self.coeffs[6:]
+        t = _fq6_mul(a0, a1, xi0)
+        s = _fq6_mul(
+            [x + y for x, y in zip(a0, a1)],
+            [x + y for x, y in zip(a0, _fq6_mul_by_v(a1, xi0))],
+            xi0,
+        )
+        c0 = [x - y - z for x, y, z in zip(s, t, _fq6_mul_by_v(t, xi0))]
+        return type(self)(c0 + [2 * x for x in t])
+
+    def conjugate(self: T_FQ12) -> T_FQ12:
+        """
+        The field_modulus**6-th power Frobenius map: a0 + a1 * w -> a0 - a1 * w.
+        On the cyclotomic subgroup this is also the inverse.
+        """
+        return type(self)(self.coeffs[:6] + tuple(-x for x in self.coeffs[6:]))
+
+    def cyclotomic_square(self: T_FQ12) -> T_FQ12:
+        """
+        Squaring for elements of the cyclotomic subgroup (the image of the easy part
+        of the final exponentiation), following Granger and Scott,
+        "Faster Squaring in the Cyclotomic Subgroup of Sixth Degree Extensions"
+        https://eprint.iacr.org/2009/565
+
+        Writing the element as A + B * w + C * w**2 over
+        FQ4 = FQ2[t] / (t**2 - xi), t = w**3:
+        f**2 = (3 * A**2 - 2 * conj(A)) + (3 * t * C**2 + 2 * conj(B)) * w
+               + (3 * B**2 - 2 * conj(C)) * w**2
+        The result is meaningless for elements outside of the subgroup.
+        """
+        xi0 = self.FQ6_NON_RESIDUE[0]
+        # Tower coefficients, in FQ2 pairs, of v**0, v**1, v**2, w, v * w, v**2 * w,
+        # i.e. of w**0, w**2, w**4, w**1, w**3, w**5
+        g00, g01, g10, g11, g20, g21, h00, h01, h10, h11, h20, h21 = self.coeffs
+        # A = g0 + h1 * t, B = h0 + g2 * t, C = g1 + h2 * t
+        A0, A1, At0, At1 = _fq4_square(g00, g01, h10, h11, xi0)
+        B0, B1, Bt0, Bt1 = _fq4_square(h00, h01, g20, g21, xi0)
+        C0, C1, Ct0, Ct1 = _fq4_square(g10, g11, h20, h21, xi0)
+        # t * C**2 = xi * Ct + C * t
+        tC0, tC1 = _fq2_mul_by_xi(Ct0, Ct1, xi0)
+        return type(self)(
+            [
+                3 * A0 - 2 * g00,
+                3 * A1 - 2 * g01,
+                3 * B0 - 2 * g10,
+                3 * B1 - 2 * g11,
+                3 * C0 - 2 * g20,
+                3 * C1 - 2 * g21,
+                3 * tC0 + 2 * h00,
+                3 * tC1 + 2 * h01,
+                3 * At0 + 2 * h10,
+                3 * At1 + 2 * h11,
+                3 * Bt0 + 2 * h20,
+                3 * Bt1 + 2 * h21,
+            ]
+        )
+
+    def inv(self: T_FQ12) -> T_FQ12:
+        # 1 / (a0 + a1 * w) = (a0 - a1 * w) / (a0**2 - v * a1**2)
+        # Like the flat fields, maps zero to zero
+        if not any(self.coeffs):
+            return self
+        q = self.field_modulus
+        xi0 = self.FQ6_NON_RESIDUE[0]
+        a0, a1 = self.coeffs[:6], self.coeffs[6:]
+        t0 = _fq6_mul(a0, a0, xi0)
+        t1 = _fq6_mul_by_v(_fq6_mul(a1, a1, xi0), xi0)
+        n = _fq6_inv([(x - y) % q for x, y in zip(t0, t1)], q, xi0)
+        return type(self)(_fq6_mul(a0, n, xi0) + [-x for x in _fq6_mul(a1, n, xi0)])
+
+    def __truediv__(self: T_FQ12, other: T_FQ12) -> T_FQ12:
+        return self * other.inv()
+
+    def __pow__(self: T_FQ12, other: int) -> T_FQ12:
+        o = self.one()
+        for bit in bin(other)[2:]:
+            o = o.square()
+            if bit == "1":
+                o = o * self
+        return o
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, type(self)):
+            raise TypeError(
+                f"Expected an FQ12 object, but got object of type {type(other)}"
+            )
+        return self.coeffs == other.coeffs
+
+    def __ne__(self, other: Any) -> bool:
+        return not self == other
+
+    def __repr__(self) -> str:
+        return repr(self.coeffs)
+
+    @classmethod
+    def one(cls: type[T_FQ12]) -> T_FQ12:
+        return cls([1] + [0] * 11)
+
+    @classmethod
+    def zero(cls: type[T_FQ12]) -> T_FQ12:
+        return cls([0] * 12)
+
+
+def _fq4_square(
+    a0: int, a1: int, b0: int, b1: int, xi0: int
+) -> tuple[int, int, int, int]:
+    # (a + b * t)**2 = (a**2 + xi * b**2) + 2 * a * b * t, with t**2 = xi
+    s0, s1 = _fq2_mul(a0, a1, a0, a1)
+    t0, t1 = _fq2_mul_by_xi(*_fq2_mul(b0, b1, b0, b1), xi0)
+    u0, u1 = _fq2_mul(a0, a1, b0, b1)
+    return s0 + t0, s1 + t1, 2 * u0, 2 * u1
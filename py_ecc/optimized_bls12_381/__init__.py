@@ -1,13 +1,17 @@
 from py_ecc.fields import (
     optimized_bls12_381_FQ as FQ,
     optimized_bls12_381_FQ2 as FQ2,
+    optimized_bls12_381_FQ6 as FQ6,
     optimized_bls12_381_FQ12 as FQ12,
     optimized_bls12_381_FQP as FQP,
+    optimized_bls12_381_tower_FQ2 as tower_FQ2,
+    optimized_bls12_381_tower_FQ12 as tower_FQ12,
 )
 
 from .optimized_clear_cofactor import (
     multiply_clear_cofactor_G1,
     multiply_clear_cofactor_G2,
+    psi_clear_cofactor_G2,
 )
 from .optimized_curve import (
     G1,
@@ -19,20 +23,44 @@ from .optimized_curve import (
     b,
     b2,
     b12,
+    batch_normalize,
+    comb_table,
     curve_order,
     double,
     eq,
     field_modulus,
     is_inf,
     is_on_curve,
+    msm_window_size,
+    multi_scalar_multiply,
     multiply,
+    multiply_comb,
+    multiply_G1,
+    multiply_G2,
+    multiply_wnaf,
+    multiply_wnaf_simultaneous,
     neg,
     normalize,
     twist,
+    wnaf,
+)
+from .optimized_endomorphism import (
+    gls_decompose,
+    glv_decompose,
+    multiply_by_x,
+    multiply_gls_G2,
+    multiply_glv_G1,
+    phi,
+    psi,
 )
 from .optimized_pairing import (
     final_exponentiate,
+    miller_loop_prepared,
+    multi_miller_loop,
+    multi_miller_loop_prepared,
+    multi_pairing,
     pairing,
+    prepare_G2,
 )
 from .optimized_swu import (
     iso_map_G1,
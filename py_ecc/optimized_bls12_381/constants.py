@@ -309,3 +309,28 @@ ISO_11_MAP_COEFFICIENTS = (
 
 # from https://datatracker.ietf.org/doc/html/draft-irtf-cfrg-hash-to-curve-09#section-8.8.1  # noqa: E501
 H_EFF_G1 = 0xD201000000010001
+
+#
+# Endomorphisms
+#
+# The BLS parameter x of the curve
+BLS_X = -0xD201000000010000
+# A cube root of unity in FQ; (x, y) -> (BETA * x, y) acts on G1 as multiplication
+# by -BLS_X**2, a cube root of unity modulo the curve order
+BETA = FQ(
+    0x5F19672FDF76CE51BA69C6076A0F77EADDB3A93BE6F89688DE17D813620A00022E01FFFFFFFEFFFE  # noqa: E501
+)
+# psi(x, y) = (PSI_C1 * conj(x), PSI_C2 * conj(y)) on the twist, with
+# PSI_C1 = 1 / (1 + i)**((p - 1) / 3) and PSI_C2 = 1 / (1 + i)**((p - 1) / 2)
+PSI_C1 = FQ2(
+    [
+        0,
+        0x1A0111EA397FE699EC02408663D4DE85AA0D857D89759AD4897D29650FB85F9B409427EB4F49FFFD8BFD00000000AAAD,  # noqa: E501
+    ]
+)
+PSI_C2 = FQ2(
+    [
+        0x135203E60180A68EE2E9C448D77A2CD91C3DEDD930B1CF60EF396489F61EB45E304466CF3E67FA0AF1EE7B04121BDEA2,  # noqa: E501
+        0x6AF0E0437FF400B6831E36D6BD17FFE48395DABC2D3435E77F76E17009241C5EE67992F72EC05F4C81084FBEDE3CC09,  # noqa: E501
+    ]
+)
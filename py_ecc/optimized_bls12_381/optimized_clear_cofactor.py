@@ -1,27 +1,51 @@
+from py_ecc.fields import (
+    optimized_bls12_381_FQ2 as FQ2,
+)
 from py_ecc.typing import (
     Optimized_Field,
     Optimized_Point3D,
 )
 
 from .constants import (
-    H_EFF_G1,
     H_EFF_G2,
 )
 from .optimized_curve import (
+    add,
+    double,
     multiply,
+    neg,
+)
+from .optimized_endomorphism import (
+    multiply_by_x,
+    psi,
 )
 
 
+# H_EFF_G1 == 1 - x, so the multiplication only takes a multiplication by x
 def multiply_clear_cofactor_G1(
     p: Optimized_Point3D[Optimized_Field],
 ) -> Optimized_Point3D[Optimized_Field]:
-    return multiply(p, H_EFF_G1)
+    return add(p, neg(multiply_by_x(p)))
 
 
 # Cofactor Clearing Method by Multiplication
-# There is an optimization based on this Section 4.1 of https://eprint.iacr.org/2017/419
-# However there is a patent `US patent 7110538` so I'm not sure if it can be used.
 def multiply_clear_cofactor_G2(
     p: Optimized_Point3D[Optimized_Field],
 ) -> Optimized_Point3D[Optimized_Field]:
     return multiply(p, H_EFF_G2)
+
+
+# Cofactor clearing with the psi endomorphism, from Section 4.1 of
+# https://eprint.iacr.org/2017/419 (Budroni and Pintore), as in Appendix G.3 of
+# the hash-to-curve RFC: H_EFF_G2 * P ==
+#     (x**2 - x - 1) * P + (x - 1) * psi(P) + psi(psi(2 * P))
+# which only takes two multiplications by x.
+def psi_clear_cofactor_G2(p: Optimized_Point3D[FQ2]) -> Optimized_Point3D[FQ2]:
+    t1 = multiply_by_x(p)
+    t2 = psi(p)
+    t3 = psi(psi(double(p)))
+    t3 = add(t3, neg(t2))
+    t2 = multiply_by_x(add(t1, t2))
+    t3 = add(t3, t2)
+    t3 = add(t3, neg(t1))
+    return add(t3, neg(p))
@@ -0,0 +1,89 @@
+from py_ecc.fields import (
+    optimized_bls12_381_FQ as FQ,
+    optimized_bls12_381_FQ2 as FQ2,
+)
+from py_ecc.typing import (
+    Optimized_Field,
+    Optimized_Point3D,
+)
+
+from .constants import (
+    BETA,
+    BLS_X,
+    PSI_C1,
+    PSI_C2,
+)
+from .optimized_curve import (
+    add,
+    curve_order,
+    double,
+    multiply_wnaf_simultaneous,
+    neg,
+)
+
+
+# Multiplication by BLS_X, whose absolute value has only six set bits
+def multiply_by_x(
+    pt: Optimized_Point3D[Optimized_Field],
+) -> Optimized_Point3D[Optimized_Field]:
+    result = pt
+    for bit in bin(-BLS_X)[3:]:
+        result = double(result)
+        if bit == "1":
+            result = add(result, pt)
+    return neg(result)
+
+
+# The endomorphism phi(x, y) = (BETA * x, y) of E(FQ). On G1 it equals
+# multiplication by -BLS_X**2
+def phi(pt: Optimized_Point3D[FQ]) -> Optimized_Point3D[FQ]:
+    x, y, z = pt
+    return (x * BETA, y, z)
+
+
+# GLV decomposition: n = n0 + n1 * BLS_X**2 (mod curve_order), with n0 and n1
+# non-negative and about 128 bits each, as curve_order = x**4 - x**2 + 1
+def glv_decompose(n: int) -> tuple[int, int]:
+    n1, n0 = divmod(n % curve_order, BLS_X**2)
+    return n0, n1
+
+
+# Multiplication of a point of G1 by n as n0 * P + n1 * (-phi(P)), evaluated
+# simultaneously over half-length scalars (Gallant, Lambert and Vanstone)
+def multiply_glv_G1(pt: Optimized_Point3D[FQ], n: int) -> Optimized_Point3D[FQ]:
+    n0, n1 = glv_decompose(n)
+    return multiply_wnaf_simultaneous([(pt, n0), (neg(phi(pt)), n1)])
+
+
+def _conjugate(x: FQ2) -> FQ2:
+    return FQ2([x.coeffs[0], -x.coeffs[1]])
+
+
+# The untwist-Frobenius-twist endomorphism psi of E'(FQ2) (Galbraith and Scott),
+# as in the hash-to-curve RFC appendix. On G2 it equals multiplication by BLS_X
+def psi(pt: Optimized_Point3D[FQ2]) -> Optimized_Point3D[FQ2]:
+    x, y, z = pt
+    return (_conjugate(x) * PSI_C1, _conjugate(y) * PSI_C2, _conjugate(z))
+
+
+# GLS decomposition: the digits of n mod curve_order in base -BLS_X, about 64 bits
+# each. n = n0 + n1 * (-BLS_X) + n2 * BLS_X**2 + n3 * (-BLS_X)**3 (mod curve_order)
+def gls_decompose(n: int) -> tuple[int, int, int, int]:
+    n %= curve_order
+    n, n0 = divmod(n, -BLS_X)
+    n, n1 = divmod(n, -BLS_X)
+    n3, n2 = divmod(n, -BLS_X)
+    return n0, n1, n2, n3
+
+
+# Multiplication of a point of G2 by n as
+# n0 * P - n1 * psi(P) + n2 * psi(psi(P)) - n3 * psi(psi(psi(P))),
+# evaluated simultaneously over quarter-length scalars (Galbraith, Lin and Scott)
+def multiply_gls_G2(pt: Optimized_Point3D[FQ2], n: int) -> Optimized_Point3D[FQ2]:
+    n0, n1, n2, n3 = gls_decompose(n)
+    psi1 = psi(pt)
+    psi2 = psi(psi1)
+    psi3 = psi(psi2)
+    return multiply_wnaf_simultaneous(
+        [(pt, n0), (neg(psi1), n1), (psi2, n2), (neg(psi3), n3)]
+    )
@@ -1,7 +1,15 @@
+from collections.abc import (
+    Sequence,
+)
+from typing import (
+    cast,
+)
+
 from py_ecc.fields import (
     optimized_bls12_381_FQ as FQ,
     optimized_bls12_381_FQ2 as FQ2,
     optimized_bls12_381_FQ12 as FQ12,
+    optimized_bls12_381_tower_FQ12 as tower_FQ12,
 )
 from py_ecc.fields.field_properties import (
     field_properties,
@@ -14,21 +22,22 @@ from py_ecc.typing import (
 
 from .optimized_curve import (
     G1,
-    add,
     b,
     b2,
     curve_order,
     double,
+    is_inf,
     is_on_curve,
     multiply,
     normalize,
-    twist,
 )
 
 field_modulus = field_properties["bls12_381"]["field_modulus"]
 
 ate_loop_count = 15132376222941642752
 log_ate_loop_count = 62
+# The BLS parameter x of the curve; the Miller loop runs over abs(x)
+curve_x = -ate_loop_count
 pseudo_binary_encoding = [
     0,
     0,
@@ -179,42 +188,120 @@ if not all(conditions):
     raise ValueError("Line function is inconsistent")
 
 
+# The Miller loop keeps R in homogeneous projective coordinates on the twist
+# E'(FQ2): y**2 = x**3 + b2. The point (x, y) of E' maps to (x / w**2, y / w**3)
+# of E(FQ12), and the line through such points, evaluated at P = (xP, yP) and
+# scaled by w**3 and an element of FQ2 (both removed by the final
+# exponentiation), is
+#     c0 + c2 * xP * w**2 + c3 * yP * w**3
+# with c0, c2 and c3 in FQ2. The step functions below return R and (c0, c2, c3),
+# following Costello, Lange and Naehrig, "Faster Pairing Computations on
+# Curves with High-Degree Twists" https://eprint.iacr.org/2009/615
+Line = tuple[FQ2, FQ2, FQ2]
+
+# 1 / 2 mod field_modulus
+half = (field_modulus + 1) // 2
+three_b2 = b2 * 3
+
+
+# The step functions reduce lazily: sums and differences that only feed a
+# product are left unreduced, while the points and lines they return are reduced
+
+
+# Double R and return the tangent line at R
+def double_step(R: Optimized_Point3D[FQ2]) -> tuple[Optimized_Point3D[FQ2], Line]:
+    X, Y, Z = R
+    A = X * Y * half
+    B = Y.square()
+    C = Z.square()
+    E = C * three_b2
+    F = E * 3
+    G = B.add_unreduced(F) * half
+    H = Y.add_unreduced(Z).square() - B - C
+    J = X.square()
+    return (
+        (
+            A * B.sub_unreduced(F),
+            G.square().sub_unreduced(E.square() * 3).reduce(),
+            B * H,
+        ),
+        (B - E, J * -3, H),
+    )
+
+
+# Add the affine point Q = (xQ, yQ) to R and return the line through R and Q
+def add_step(
+    R: Optimized_Point3D[FQ2], Q: Optimized_Point2D[FQ2]
+) -> tuple[Optimized_Point3D[FQ2], Line]:
+    X, Y, Z = R
+    xQ, yQ = Q
+    theta = Y - yQ * Z
+    lam = X - xQ * Z
+    C = theta.square()
+    D = lam.square()
+    E = lam * D
+    G = X * D
+    H = E.add_unreduced(Z * C).sub_unreduced(G * 2)
+    return (
+        (lam * H, (theta * G.sub_unreduced(H)).sub_unreduced(Y * E).reduce(), Z * E),
+        (theta * xQ - lam * yQ, -theta, lam),
+    )
+
+
+# Evaluate a line at P = (xP, yP), as a sparse element of the tower FQ12
+def eval_line(line: Line, P: Optimized_Point2D[FQ]) -> tower_FQ12:
+    xP, yP = P[0].n, P[1].n
+    # Tower coefficients of w**0, w**2, w**4, w, w**3, w**5
+    (c00, c01), (c20, c21), (c30, c31) = (
+        [int(c) for c in coeff.coeffs] for coeff in line
+    )
+    return tower_FQ12(
+        [c00, c01, c20 * xP, c21 * xP, 0, 0, 0, 0, c30 * yP, c31 * yP, 0, 0]
+    )
+
+
+# Miller loop line coefficients for a fixed Q, in the order they are used
+PreparedG2 = tuple[Line, ...]
+
+
+# Record the line coefficients of the Miller loop for Q once, so that pairings
+# with the same Q skip all the point arithmetic
+def prepare_G2(Q: Optimized_Point3D[FQ2]) -> PreparedG2:
+    if Q is None or is_inf(Q):
+        return ()
+    affine_Q = normalize(Q)
+    R: Optimized_Point3D[FQ2] = (affine_Q[0], affine_Q[1], affine_Q[0].one())
+    lines = []
+    # for i in range(log_ate_loop_count, -1, -1):
+    for v in pseudo_binary_encoding[62::-1]:
+        R, line = double_step(R)
+        lines.append(line)
+        if v == 1:
+            R, line = add_step(R, affine_Q)
+            lines.append(line)
+    return tuple(lines)
+
+
 # Main miller loop
 def miller_loop(
     Q: Optimized_Point3D[FQ2], P: Optimized_Point3D[FQ], final_exponentiate: bool = True
 ) -> FQ12:
     if Q is None or P is None:
         return FQ12.one()
-    cast_P = cast_point_to_fq12(P)
-    twist_R = twist_Q = twist(Q)
-    R: Optimized_Point3D[FQ2] = Q
-    f_num, f_den = FQ12.one(), FQ12.one()
-    # for i in range(log_ate_loop_count, -1, -1):
-    for v in pseudo_binary_encoding[62::-1]:
-        _n, _d = linefunc(twist_R, twist_R, cast_P)
-        f_num = f_num * f_num * _n
-        f_den = f_den * f_den * _d
-        R = double(R)
-        twist_R = twist(R)
-        if v == 1:
-            _n, _d = linefunc(twist_R, twist_Q, cast_P)
-            f_num = f_num * _n
-            f_den = f_den * _d
-            R = add(R, Q)
-            twist_R = twist(R)
-    # assert R == multiply(Q, ate_loop_count)
-    # Q1 = (Q[0] ** field_modulus, Q[1] ** field_modulus, Q[2] ** field_modulus)
-    # assert is_on_curve(Q1, b12)
-    # nQ2 = (Q1[0] ** field_modulus, -Q1[1] ** field_modulus, Q1[2] ** field_modulus)
-    # assert is_on_curve(nQ2, b12)
-    # _n1, _d1 = linefunc(R, Q1, P)
-    # R = add(R, Q1)
-    # _n2, _d2 = linefunc(R, nQ2, P)
-    # f = f_num * _n1 * _n2 / (f_den * _d1 * _d2)
-    f = f_num / f_den
-    # R = add(R, nQ2) This line is in many specifications but technically does nothing
+    f = multi_miller_loop([(Q, P)])
     if final_exponentiate:
-        return f ** ((field_modulus**12 - 1) // curve_order)
+        return _final_exponentiate(f)
+    else:
+        return f
+
+
+# Miller loop for a Q prepared with prepare_G2
+def miller_loop_prepared(
+    prepared_Q: PreparedG2, P: Optimized_Point3D[FQ], final_exponentiate: bool = True
+) -> FQ12:
+    f = multi_miller_loop_prepared([(prepared_Q, P)])
+    if final_exponentiate:
+        return _final_exponentiate(f)
     else:
         return f
 
@@ -232,18 +319,101 @@ def pairing(
     return miller_loop(Q, P, final_exponentiate=final_exponentiate)
 
 
-exptable = [FQ12([0] * i + [1] + [0] * (11 - i)) ** field_modulus for i in range(12)]
+# Miller loop over several (Q, P) pairs evaluated in lockstep, so that the
+# squarings of the accumulator are shared by all pairs
+def multi_miller_loop(
+    pairs: Sequence[tuple[Optimized_Point3D[FQ2], Optimized_Point3D[FQ]]],
+) -> FQ12:
+    return multi_miller_loop_prepared([(prepare_G2(Q), P) for Q, P in pairs])
+
+
+def multi_miller_loop_prepared(
+    pairs: Sequence[tuple[PreparedG2, Optimized_Point3D[FQ]]],
+) -> FQ12:
+    prepared = [
+        (prepared_Q, normalize(P))
+        for prepared_Q, P in pairs
+        if prepared_Q and not (P is None or is_inf(P))
+    ]
+    f = tower_FQ12.one()
+    # Index of the doubling line of the current iteration in each prepared Q
+    i = 0
+    for v in pseudo_binary_encoding[62::-1]:
+        f = f.square()
+        for prepared_Q, affine_P in prepared:
+            f = f.mul_by_sparse(eval_line(prepared_Q[i], affine_P))
+            if v == 1:
+                f = f.mul_by_sparse(eval_line(prepared_Q[i + 1], affine_P))
+        i += 1 + v
+    return cast(FQ12, f.to_fqp())
+
+
+# Product of the pairings of all (Q, P) pairs, computed with a single
+# final exponentiation
+def multi_pairing(
+    pairs: Sequence[tuple[Optimized_Point3D[FQ2], Optimized_Point3D[FQ]]],
+    final_exponentiate: bool = True,
+) -> FQ12:
+    for Q, P in pairs:
+        if not is_on_curve(Q, b2):
+            raise ValueError("Invalid input - point Q is not on the correct curve")
+        if not is_on_curve(P, b):
+            raise ValueError("Invalid input - point P is not on the correct curves")
+    f = multi_miller_loop(
+        [
+            (Q, P)
+            for Q, P in pairs
+            if not (P[-1] == (P[-1].zero()) or Q[-1] == (Q[-1].zero()))
+        ]
+    )
+    if final_exponentiate:
+        return _final_exponentiate(f)
+    else:
+        return f
 
 
 def exp_by_p(x: FQ12) -> FQ12:
-    return sum(
-        (table_entry * int(coeff) for table_entry, coeff in zip(exptable, x.coeffs)),
-        FQ12.zero(),
+    return x.frobenius()
+
+
+# Square-and-multiply exponentiation in the cyclotomic subgroup.
+# Negative exponents are handled with the (free) conjugation
+def cyclotomic_exp(f: tower_FQ12, n: int) -> tower_FQ12:
+    o = tower_FQ12.one()
+    for bit in bin(abs(n))[2:]:
+        o = o.cyclotomic_square()
+        if bit == "1":
+            o = o * f
+    return o.conjugate() if n < 0 else o
+
+
+def tower_frobenius(x: tower_FQ12, k: int = 1) -> tower_FQ12:
+    return tower_FQ12.from_fqp(cast(FQ12, x.to_fqp()).frobenius(k))
+
+
+# Under a private name, as the Miller loops take a ``final_exponentiate`` flag
+def _final_exponentiate(p: FQ12) -> FQ12:
+    # Zero is not in the cyclotomic subgroup; like any power of it, its image is 0
+    if p == p.zero():
+        return p
+    f = tower_FQ12.from_fqp(p)
+    # Easy part: f ** ((field_modulus**6 - 1) * (field_modulus**2 + 1))
+    f1 = f.conjugate() / f
+    f2 = tower_frobenius(f1, 2) * f1
+    # Hard part: f2 ** ((field_modulus**4 - field_modulus**2 + 1) // curve_order),
+    # using the decomposition of the exponent in the BLS parameter x
+    # (field_modulus**4 - field_modulus**2 + 1) // curve_order
+    #     == (x - 1)**2 // 3 * (x + field_modulus) * (x**2 + field_modulus**2 - 1) + 1
+    t0 = cyclotomic_exp(f2, (curve_x - 1) // 3)
+    t0 = cyclotomic_exp(t0, curve_x) * t0.conjugate()
+    t1 = cyclotomic_exp(t0, curve_x) * tower_frobenius(t0)
+    t2 = (
+        cyclotomic_exp(cyclotomic_exp(t1, curve_x), curve_x)
+        * tower_frobenius(t1, 2)
+        * t1.conjugate()
     )
+    return cast(FQ12, (t2 * f2).to_fqp())
 
 
 def final_exponentiate(p: FQ12) -> FQ12:
-    cofactor = (field_modulus**4 - field_modulus**2 + 1) // curve_order
-    p2 = exp_by_p(exp_by_p(p)) * p
-    p3 = exp_by_p(exp_by_p(exp_by_p(exp_by_p(exp_by_p(exp_by_p(p2)))))) / p2
-    return p3**cofactor
+    return _final_exponentiate(p)
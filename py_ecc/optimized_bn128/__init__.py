@@ -1,8 +1,11 @@
 from py_ecc.fields import (
     optimized_bn128_FQ as FQ,
     optimized_bn128_FQ2 as FQ2,
+    optimized_bn128_FQ6 as FQ6,
     optimized_bn128_FQ12 as FQ12,
     optimized_bn128_FQP as FQP,
+    optimized_bn128_tower_FQ2 as tower_FQ2,
+    optimized_bn128_tower_FQ12 as tower_FQ12,
 )
 
 from .optimized_curve import (
@@ -15,16 +18,26 @@ from .optimized_curve import (
     b,
     b2,
     b12,
+    batch_normalize,
+    comb_table,
     curve_order,
     double,
     eq,
     field_modulus,
     is_inf,
     is_on_curve,
+    msm_window_size,
+    multi_scalar_multiply,
     multiply,
+    multiply_comb,
+    multiply_G1,
+    multiply_G2,
+    multiply_wnaf,
+    multiply_wnaf_simultaneous,
     neg,
     normalize,
     twist,
+    wnaf,
 )
 from .optimized_pairing import (
     final_exponentiate,
@@ -1,3 +1,10 @@
+from collections.abc import (
+    Sequence,
+)
+from functools import (
+    cache,
+)
+
 from py_ecc.fields import (
     optimized_bn128_FQ as FQ,
     optimized_bn128_FQ2 as FQ2,
@@ -144,6 +151,172 @@ def multiply(
         return add(multiply(double(pt), int(n // 2)), pt)
 
 
+# Width-`width` non-adjacent form of n >= 0, least significant digit first:
+# every non-zero digit is odd, below 2**(width - 1) in absolute value, and is
+# followed by at least width - 1 zeros
+def wnaf(n: int, width: int) -> list[int]:
+    digits = []
+    while n:
+        if n & 1:
+            digit = n & ((1 << width) - 1)
+            if digit >= 1 << (width - 1):
+                digit -= 1 << width
+            n -= digit
+        else:
+            digit = 0
+        digits.append(digit)
+        n >>= 1
+    return digits
+
+
+# Elliptic curve point multiplication over the wNAF of n. Iterative, and only
+# adds a precomputed odd multiple of pt for one digit in about width + 1
+def multiply_wnaf(
+    pt: Optimized_Point3D[Optimized_Field], n: int, width: int = 5
+) -> Optimized_Point3D[Optimized_Field]:
+    return multiply_wnaf_simultaneous([(pt, n)], width)
+
+
+# Sum of n * pt over the (pt, n) terms, with the wNAFs of all the scalars
+# interleaved over one shared chain of doublings (Straus). Needs at least one term
+def multiply_wnaf_simultaneous(
+    terms: Sequence[tuple[Optimized_Point3D[Optimized_Field], int]], width: int = 5
+) -> Optimized_Point3D[Optimized_Field]:
+    one, zero = terms[0][0][0].one(), terms[0][0][0].zero()
+    tables = []
+    for pt, n in terms:
+        if n < 0:
+            pt, n = neg(pt), -n
+        if n == 0 or is_inf(pt):
+            continue
+        # pt, 3 * pt, 5 * pt, ..., (2**(width - 1) - 1) * pt
+        twice = double(pt)
+        odd_multiples = [pt]
+        for _ in range(2 ** (width - 2) - 1):
+            odd_multiples.append(add(odd_multiples[-1], twice))
+        tables.append((odd_multiples, wnaf(n, width)))
+    result = (one, one, zero)
+    for i in range(max((len(digits) for _, digits in tables), default=0) - 1, -1, -1):
+        result = double(result)
+        for odd_multiples, digits in tables:
+            digit = digits[i] if i < len(digits) else 0
+            if digit > 0:
+                result = add(result, odd_multiples[digit >> 1])
+            elif digit < 0:
+                result = add(result, neg(odd_multiples[-digit >> 1]))
+    return result
+
+
+# Below this many points multi_scalar_multiply uses multiply_wnaf_simultaneous
+MSM_STRAUS_THRESHOLD = 512
+
+
+# Window size in bits for the bucket method over n points, about minimizing
+# (bits / c) * (n + 2**(c + 1)) additions
+def msm_window_size(n: int) -> int:
+    return max(2, n.bit_length() - 4)
+
+
+# Sum of scalars[i] * points[i], with the bucket method of Pippenger. Each window
+# of c bits of the scalars is summed with one addition per point into 2**c - 1
+# buckets, which are then combined with about 2**(c + 1) additions
+def multi_scalar_multiply(
+    points: Sequence[Optimized_Point3D[Optimized_Field]],
+    scalars: Sequence[int],
+    window: int | None = None,
+) -> Optimized_Point3D[Optimized_Field]:
+    if len(points) != len(scalars):
+        raise ValueError(
+            f"Got {len(points)} points but {len(scalars)} scalars, expected the same"
+        )
+    if not points:
+        raise ValueError("Expected at least one point")
+    if window is None and len(points) < MSM_STRAUS_THRESHOLD:
+        return multiply_wnaf_simultaneous(list(zip(points, scalars)))
+    one, zero = points[0][0].one(), points[0][0].zero()
+    terms = []
+    for pt, n in zip(points, scalars):
+        if n < 0:
+            pt, n = neg(pt), -n
+        if n != 0 and not is_inf(pt):
+            terms.append((pt, n))
+    c = msm_window_size(len(terms)) if window is None else window
+    mask = (1 << c) - 1
+    bits = max((n.bit_length() for _, n in terms), default=0)
+    result = (one, one, zero)
+    for start in range((bits - 1) // c * c, -1, -c):
+        for _ in range(c):
+            result = double(result)
+        buckets = [(one, one, zero)] * mask
+        for pt, n in terms:
+            index = (n >> start) & mask
+            if index:
+                buckets[index - 1] = add(buckets[index - 1], pt)
+        # sum(index * bucket[index]) as a sum of running sums
+        running_sum = window_sum = (one, one, zero)
+        for bucket in reversed(buckets):
+            running_sum = add(running_sum, bucket)
+            window_sum = add(window_sum, running_sum)
+        result = add(result, window_sum)
+    return result
+
+
+# Fixed-base comb table (Lim and Lee) for a point of order curve_order. With
+# d = ceil(log2(curve_order) / width), entry j is the sum of 2**(i * d) * pt over
+# the set bits i of j
+def comb_table(
+    pt: Optimized_Point3D[Optimized_Field], width: int = 8
+) -> list[Optimized_Point3D[Optimized_Field]]:
+    one, zero = pt[0].one(), pt[0].zero()
+    d = -(-curve_order.bit_length() // width)
+    teeth = [pt]
+    for _ in range(width - 1):
+        tooth = teeth[-1]
+        for _ in range(d):
+            tooth = double(tooth)
+        teeth.append(tooth)
+    table = [(one, one, zero)]
+    for tooth in teeth:
+        table += [add(entry, tooth) for entry in table]
+    return table
+
+
+# Multiply the point of a comb table by n, with d doublings and d additions
+def multiply_comb(
+    table: list[Optimized_Point3D[Optimized_Field]], n: int
+) -> Optimized_Point3D[Optimized_Field]:
+    width = len(table).bit_length() - 1
+    d = -(-curve_order.bit_length() // width)
+    n %= curve_order
+    result = table[0]
+    for j in range(d - 1, -1, -1):
+        result = double(result)
+        index = 0
+        for i in range(width):
+            index |= ((n >> (i * d + j)) & 1) << i
+        result = add(result, table[index])
+    return result
+
+
+# Comb tables for the generators, built on first use
+@cache
+def _G1_comb_table() -> list[Optimized_Point3D[FQ]]:
+    return comb_table(G1)
+
+
+@cache
+def _G2_comb_table() -> list[Optimized_Point3D[FQ2]]:
+    return comb_table(G2)
+
+
+def multiply_G1(n: int) -> Optimized_Point3D[FQ]:
+    return multiply_comb(_G1_comb_table(), n)
+
+
+def multiply_G2(n: int) -> Optimized_Point3D[FQ2]:
+    return multiply_comb(_G2_comb_table(), n)
+
+
 def eq(
     p1: Optimized_Point3D[Optimized_Field], p2: Optimized_Point3D[Optimized_Field]
 ) -> bool:
@@ -159,6 +332,34 @@ def normalize(
     return (x / z, y / z)
 
 
+# Normalize several points with a single field inversion, using Montgomery's
+# simultaneous inversion. Like normalize, maps the point at infinity to (0, 0)
+def batch_normalize(
+    points: Sequence[Optimized_Point3D[Optimized_Field]],
+) -> list[Optimized_Point2D[Optimized_Field]]:
+    if not points:
+        return []
+    one, zero = points[0][0].one(), points[0][0].zero()
+    # prefixes[i] is the product of the non-zero z of points[:i]
+    prefixes = []
+    product = one
+    for _, _, z in points:
+        prefixes.append(product)
+        if z != zero:
+            product = product * z
+    inv = one / product
+    result: list[Optimized_Point2D[Optimized_Field]] = [(zero, zero)] * len(points)
+    for i in range(len(points) - 1, -1, -1):
+        x, y, z = points[i]
+        if z == zero:
+            continue
+        # inv is 1 / (product of the non-zero z of points[:i + 1])
+        z_inv = inv * prefixes[i]
+        inv = inv * z
+        result[i] = (x * z_inv, y * z_inv)
+    return result
+
+
 # "Twist" a point in E(FQ2) into a point in E(FQ12)
 w = FQ12([0, 1] + [0] * 10)
 
@@ -1,7 +1,12 @@
+from typing import (
+    cast,
+)
+
 from py_ecc.fields import (
     optimized_bn128_FQ as FQ,
     optimized_bn128_FQ2 as FQ2,
     optimized_bn128_FQ12 as FQ12,
+    optimized_bn128_tower_FQ12 as tower_FQ12,
 )
 from py_ecc.fields.field_properties import (
     field_properties,
@@ -189,37 +194,43 @@ def miller_loop(
     if Q is None or P is None:
         return FQ12.one()
     R: Optimized_Point3D[FQ12] = Q
-    f_num, f_den = FQ12.one(), FQ12.one()
+    # The accumulators live in the tower, where the sparse line values are cheap to
+    # multiply in
+    f_num, f_den = tower_FQ12.one(), tower_FQ12.one()
     # for i in range(log_ate_loop_count, -1, -1):
     for v in pseudo_binary_encoding[63::-1]:
         _n, _d = linefunc(R, R, P)
-        f_num = f_num * f_num * _n
-        f_den = f_den * f_den * _d
+        f_num = f_num.square().mul_by_sparse(tower_FQ12.from_fqp(_n))
+        f_den = f_den.square().mul_by_sparse(tower_FQ12.from_fqp(_d))
         R = double(R)
         # if ate_loop_count & (2**i):
         if v == 1:
             _n, _d = linefunc(R, Q, P)
-            f_num = f_num * _n
-            f_den = f_den * _d
+            f_num = f_num.mul_by_sparse(tower_FQ12.from_fqp(_n))
+            f_den = f_den.mul_by_sparse(tower_FQ12.from_fqp(_d))
             R = add(R, Q)
         elif v == -1:
             nQ = neg(Q)
             _n, _d = linefunc(R, nQ, P)
-            f_num = f_num * _n
-            f_den = f_den * _d
+            f_num = f_num.mul_by_sparse(tower_FQ12.from_fqp(_n))
+            f_den = f_den.mul_by_sparse(tower_FQ12.from_fqp(_d))
             R = add(R, nQ)
     # assert R == multiply(Q, ate_loop_count)
-    Q1 = (Q[0] ** field_modulus, Q[1] ** field_modulus, Q[2] ** field_modulus)
+    Q1 = (Q[0].frobenius(), Q[1].frobenius(), Q[2].frobenius())
     # assert is_on_curve(Q1, b12)
-    nQ2 = (Q1[0] ** field_modulus, -Q1[1] ** field_modulus, Q1[2] ** field_modulus)
+    nQ2 = (Q[0].frobenius(2), -Q[1].frobenius(2), Q[2].frobenius(2))
     # assert is_on_curve(nQ2, b12)
     _n1, _d1 = linefunc(R, Q1, P)
     R = add(R, Q1)
     _n2, _d2 = linefunc(R, nQ2, P)
-    f = f_num * _n1 * _n2 / (f_den * _d1 * _d2)
+    f_num = f_num.mul_by_sparse(tower_FQ12.from_fqp(_n1))
+    f_num = f_num.mul_by_sparse(tower_FQ12.from_fqp(_n2))
+    f_den = f_den.mul_by_sparse(tower_FQ12.from_fqp(_d1))
+    f_den = f_den.mul_by_sparse(tower_FQ12.from_fqp(_d2))
+    f = cast(FQ12, (f_num / f_den).to_fqp())
     # R = add(R, nQ2) This line is in many specifications but technically does nothing
     if final_exponentiate:
-        return f ** ((field_modulus**12 - 1) // curve_order)
+        return _final_exponentiate(f)
     else:
         return f
 
@@ -239,5 +250,14 @@ def pairing(
     )
 
 
-def final_exponentiate(p: Optimized_Field) -> Optimized_Field:
-    return p ** ((field_modulus**12 - 1) // curve_order)
+# Under a private name, as ``miller_loop`` takes a ``final_exponentiate`` flag
+def _final_exponentiate(p: FQ12) -> FQ12:
+    # Easy part: p ** ((field_modulus**6 - 1) * (field_modulus**2 + 1))
+    f = p.frobenius(6) / p
+    f = f.frobenius(2) * f
+    # Hard part
+    return f ** ((field_modulus**4 - field_modulus**2 + 1) // curve_order)
+
+
+def final_exponentiate(p: FQ12) -> FQ12:
+    return _final_exponentiate(p)
@@ -39,6 +39,28 @@ def test_aggregate_verify(SKs, messages, result):
     assert G2Basic.AggregateVerify(PKs, messages, aggregate_signature) == result
 
 
+def test_aggregate_verify_parallel(executor):
+    SKs = list(range(1, 6))
+    PKs = [G2Basic.SkToPk(SK) for SK in SKs]
+    messages = [bytes([SK]) * 32 for SK in SKs]
+    aggregate_signature = G2Basic.Aggregate(
+        [G2Basic.Sign(SK, msg) for SK, msg in zip(SKs, messages)]
+    )
+    cases = [
+        (PKs, messages, aggregate_signature),
+        (PKs[::-1], messages, aggregate_signature),
+        (PKs, messages, G2Basic.Sign(1, messages[0])),
+        (PKs[:-1] + [Z1_PUBKEY], messages, aggregate_signature),
+        (PKs, messages[:-1] + [b"\x00" * 32], aggregate_signature),
+        (PKs, messages, Z2_SIGNATURE),
+        (PKs[:1], messages[:1], aggregate_signature),
+    ]
+    expected = [True] + [False] * (len(cases) - 1)
+    for args, result in zip(cases, expected):
+        assert G2Basic.AggregateVerify(*args) == result
+        assert G2Basic.AggregateVerify(*args, executor=executor) == result
+
+
 @pytest.mark.parametrize(
     "privkey, success",
     [
@@ -111,3 +133,45 @@ SAMPLE_MESSAGE = b"helloworld"
 )
 def test_verify(pubkey, message, signature, result):
     assert G2Basic.Verify(pubkey, message, signature) == result
+
+
+BATCH_SKS = [1, 2, 3, 4]
+BATCH_MESSAGES = [b"hello", b"world", b"hello", b"batch"]
+BATCH_TRIPLES = [
+    (G2Basic.SkToPk(sk), msg, G2Basic.Sign(sk, msg))
+    for sk, msg in zip(BATCH_SKS, BATCH_MESSAGES)
+]
+
+
+@pytest.mark.parametrize(
+    "triples, result, invalid",
+    [
+        (BATCH_TRIPLES, True, []),
+        (BATCH_TRIPLES[:1], True, []),
+        ([], False, []),
+        (
+            # Swapped signatures
+            BATCH_TRIPLES[:1]
+            + [BATCH_TRIPLES[1][:2] + BATCH_TRIPLES[3][2:]]
+            + BATCH_TRIPLES[2:3]
+            + [BATCH_TRIPLES[3][:2] + BATCH_TRIPLES[1][2:]],
+            False,
+            [1, 3],
+        ),
+        (
+            # Malformed pubkey
+            BATCH_TRIPLES[:2] + [(Z1_PUBKEY,) + BATCH_TRIPLES[2][1:]],
+            False,
+            [2],
+        ),
+        (
+            # Signature at infinity
+            [BATCH_TRIPLES[0][:2] + (Z2_SIGNATURE,)] + BATCH_TRIPLES[1:],
+            False,
+            [0],
+        ),
+    ],
+)
+def test_batch_verify(triples, result, invalid):
+    assert G2Basic.BatchVerify(triples) == result
+    assert G2Basic.BatchFindInvalid(triples) == invalid
@@ -30,3 +30,23 @@ def test_aggregate_verify(SKs, messages):
     signatures = [G2MessageAugmentation.Sign(SK, msg) for SK, msg in zip(SKs, messages)]
     aggregate_signature = G2MessageAugmentation.Aggregate(signatures)
     assert G2MessageAugmentation.AggregateVerify(PKs, messages, aggregate_signature)
+
+
+def test_batch_verify():
+    SKs = [1, 2, 3]
+    message = b"message"
+    triples = [
+        (
+            G2MessageAugmentation.SkToPk(SK),
+            message,
+            G2MessageAugmentation.Sign(SK, message),
+        )
+        for SK in SKs
+    ]
+    assert G2MessageAugmentation.BatchVerify(triples)
+    assert G2MessageAugmentation.BatchFindInvalid(triples) == []
+
+    # The signature is only valid for the augmented message of its own pubkey
+    triples[0] = (triples[1][0],) + triples[0][1:]
+    assert not G2MessageAugmentation.BatchVerify(triples)
+    assert G2MessageAugmentation.BatchFindInvalid(triples) == [0]
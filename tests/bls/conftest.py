@@ -0,0 +1,23 @@
+import pytest
+from concurrent.futures import (
+    ProcessPoolExecutor,
+)
+
+from py_ecc.bls.cache import (
+    pubkey_cache,
+)
+
+
+@pytest.fixture(scope="session")
+def executor():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+@pytest.fixture
+def empty_pubkey_cache():
+    maxsize = pubkey_cache.maxsize
+    pubkey_cache.clear()
+    yield pubkey_cache
+    pubkey_cache.resize(maxsize)
+    pubkey_cache.clear()
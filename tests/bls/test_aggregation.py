@@ -0,0 +1,63 @@
+import pytest
+
+from eth_utils import (
+    ValidationError,
+)
+
+from py_ecc.bls import (
+    G2ProofOfPossession,
+    PubkeyAggregator,
+    SignatureAggregator,
+)
+
+SKs = [1, 5, 124, 735]
+PKs = [G2ProofOfPossession.SkToPk(SK) for SK in SKs]
+message = b"\x42" * 32
+signatures = [G2ProofOfPossession.Sign(SK, message) for SK in SKs]
+
+
+def test_signature_aggregator():
+    aggregator = SignatureAggregator(signatures[:2])
+    for signature in signatures[2:]:
+        aggregator.add(signature)
+    assert len(aggregator) == 4
+    assert aggregator.aggregate() == G2ProofOfPossession.Aggregate(signatures)
+
+    aggregator.remove(signatures[0])
+    assert aggregator.aggregate() == G2ProofOfPossession.Aggregate(signatures[1:])
+
+    other = SignatureAggregator(signatures[:1])
+    other.merge(aggregator)
+    assert len(other) == 4
+    assert other.aggregate() == G2ProofOfPossession.Aggregate(signatures)
+
+
+def test_pubkey_aggregator():
+    aggregator = PubkeyAggregator(PKs)
+    aggregate_pubkey = aggregator.aggregate()
+    assert aggregate_pubkey == G2ProofOfPossession._AggregatePKs(PKs)
+    assert G2ProofOfPossession.Verify(
+        aggregate_pubkey, message, SignatureAggregator(signatures).aggregate()
+    )
+
+    aggregator.remove(PKs[-1])
+    assert aggregator.aggregate() == G2ProofOfPossession._AggregatePKs(PKs[:-1])
+
+
+def test_aggregator_validation():
+    with pytest.raises(ValidationError):
+        SignatureAggregator().aggregate()
+    with pytest.raises(ValidationError):
+        PubkeyAggregator().remove(PKs[0])
+    aggregator = PubkeyAggregator(PKs[:1])
+    with pytest.raises(ValidationError):
+        aggregator.remove(PKs[1])
+    assert len(aggregator) == 1
+    assert aggregator.aggregate() == PKs[0]
+    aggregator.remove(PKs[0])
+    with pytest.raises(ValidationError):
+        aggregator.remove(PKs[0])
+    with pytest.raises(ValidationError):
+        SignatureAggregator().add(PKs[0])
+    with pytest.raises(ValidationError):
+        PubkeyAggregator().merge(SignatureAggregator())
@@ -0,0 +1,106 @@
+import pytest
+
+from py_ecc.bls import (
+    G2Basic,
+    G2ProofOfPossession,
+)
+from py_ecc.bls.cache import (
+    LRUCache,
+    message_point_cache,
+)
+from py_ecc.bls.g2_primitives import (
+    pubkey_to_G1,
+)
+from py_ecc.bls.hash_to_curve import (
+    hash_to_G2,
+)
+
+
+def test_lru_cache():
+    cache = LRUCache(2)
+    cache.put(b"a", 1)
+    cache.put(b"b", 2)
+    assert cache.get(b"a") == 1
+    # b"b" is now the least recently used entry
+    cache.put(b"c", 3)
+    assert b"b" not in cache
+    assert cache.get(b"b") is None
+    assert (cache.get(b"a"), cache.get(b"c")) == (1, 3)
+    assert (cache.hits, cache.misses) == (3, 1)
+
+    cache.resize(1)
+    assert len(cache) == 1 and b"c" in cache
+    cache.clear()
+    assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+
+    with pytest.raises(ValueError):
+        LRUCache(-1)
+
+
+def test_disabled_lru_cache():
+    cache = LRUCache(0)
+    cache.put(b"a", 1)
+    assert cache.get(b"a") is None
+    assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+
+
+def test_pubkey_cache(empty_pubkey_cache):
+    SKs = [3, 14, 15]
+    PKs = [G2ProofOfPossession.SkToPk(SK) for SK in SKs]
+    message = b"\xab" * 32
+    signature = G2ProofOfPossession.Aggregate(
+        [G2ProofOfPossession.Sign(SK, message) for SK in SKs]
+    )
+
+    assert G2ProofOfPossession.FastAggregateVerify(PKs, message, signature)
+    assert all(PK in empty_pubkey_cache for PK in PKs)
+    # The one-off aggregate public key is not cached
+    assert len(empty_pubkey_cache) == len(set(PKs))
+    # Also with a repeated key
+    repeated_signature = G2ProofOfPossession.Aggregate(
+        [signature, G2ProofOfPossession.Sign(SKs[0], message)]
+    )
+    assert G2ProofOfPossession.FastAggregateVerify(
+        PKs + PKs[:1], message, repeated_signature
+    )
+    assert len(empty_pubkey_cache) == len(set(PKs))
+    assert empty_pubkey_cache.get(PKs[0]) == pubkey_to_G1(PKs[0])
+    hits = empty_pubkey_cache.hits
+    assert G2ProofOfPossession.FastAggregateVerify(PKs, message, signature)
+    assert empty_pubkey_cache.hits > hits
+
+    # Invalid keys are never cached
+    assert not G2ProofOfPossession.KeyValidate(b"\x11" * 48)
+    assert b"\x11" * 48 not in empty_pubkey_cache
+
+    empty_pubkey_cache.resize(0)
+    assert len(empty_pubkey_cache) == 0
+    assert G2ProofOfPossession.FastAggregateVerify(PKs, message, signature)
+    assert len(empty_pubkey_cache) == 0
+
+
+@pytest.fixture
+def enabled_message_point_cache():
+    maxsize = message_point_cache.maxsize
+    message_point_cache.resize(16)
+    message_point_cache.clear()
+    yield message_point_cache
+    message_point_cache.resize(maxsize)
+    message_point_cache.clear()
+
+
+def test_message_point_cache(enabled_message_point_cache):
+    message = b"\xcd" * 32
+    key = (message, G2Basic.DST, G2Basic.xmd_hash_function)
+    signature = G2Basic.Sign(5, message)
+    assert enabled_message_point_cache.get(key) == hash_to_G2(*key)
+
+    for SK in (5, 6, 7):
+        assert G2Basic.Verify(G2Basic.SkToPk(SK), message, G2Basic.Sign(SK, message))
+    assert G2Basic.AggregateVerify(
+        [G2Basic.SkToPk(5), G2Basic.SkToPk(8)],
+        [message, b"\xef" * 32],
+        G2Basic.Aggregate([signature, G2Basic.Sign(8, b"\xef" * 32)]),
+    )
+    assert len(enabled_message_point_cache) == 2
+    assert enabled_message_point_cache.misses == 2
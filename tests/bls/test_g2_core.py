@@ -1,13 +1,24 @@
 import pytest
 
+from eth_utils import (
+    ValidationError,
+)
+
 from py_ecc.bls import (
     G2Basic,
 )
 from py_ecc.bls.g2_primitives import (
+    G1_to_pubkey,
     G2_to_signature,
+    pubkey_to_G1,
+)
+from py_ecc.bls.hash_to_curve import (
+    map_to_curve_G1,
 )
 from py_ecc.optimized_bls12_381 import (
+    FQ,
     G2,
+    Z1,
     multiply,
 )
 
@@ -23,6 +34,51 @@ def test_key_validate(pubkey, success):
     assert G2Basic.KeyValidate(pubkey) == success
 
 
+@pytest.mark.parametrize("parallel", [False, True])
+def test_key_validate_batch(parallel, executor, empty_pubkey_cache):
+    PKs = [
+        G2Basic.SkToPk(42),
+        b"\x11" * 48,
+        G1_to_pubkey(Z1),
+        # On the curve but outside of G1
+        G1_to_pubkey(map_to_curve_G1(FQ(1))),
+        G2Basic.SkToPk(7),
+    ]
+    expected = [pubkey_to_G1(PK) if G2Basic.KeyValidate(PK) else None for PK in PKs]
+    assert [pt is not None for pt in expected] == [True, False, False, False, True]
+    executor = executor if parallel else None
+    # Drop the keys cached by computing `expected`
+    empty_pubkey_cache.clear()
+    assert G2Basic.KeyValidateBatch(PKs, executor) == expected
+    # Keys decoded in the workers are cached in this process
+    cached = [PK in empty_pubkey_cache for PK in PKs]
+    assert cached == [True, False, False, False, True]
+    buffer = b"".join(PKs)
+    for concatenated in (buffer, bytearray(buffer), memoryview(buffer)):
+        assert G2Basic.KeyValidateBatch(concatenated, executor) == expected
+    assert G2Basic.KeyValidateBatch([bytearray(PK) for PK in PKs]) == expected
+    with pytest.raises(ValidationError):
+        G2Basic.KeyValidateBatch(b"\x11" * 47)
+
+
+def test_key_validate_override():
+    rejected_PK = G2Basic.SkToPk(5)
+
+    class RestrictedG2Basic(G2Basic):
+        @staticmethod
+        def KeyValidate(PK):
+            return PK != rejected_PK and G2Basic.KeyValidate(PK)
+
+    message = b"\x42" * 32
+    signature = RestrictedG2Basic.Sign(5, message)
+    assert G2Basic.Verify(rejected_PK, message, signature)
+    assert not RestrictedG2Basic.Verify(rejected_PK, message, signature)
+    assert not RestrictedG2Basic.AggregateVerify([rejected_PK], [message], signature)
+    assert not RestrictedG2Basic.BatchVerify([(rejected_PK, message, signature)])
+    PK = RestrictedG2Basic.SkToPk(7)
+    assert RestrictedG2Basic.Verify(PK, message, RestrictedG2Basic.Sign(7, message))
+
+
 @pytest.mark.parametrize(
     "privkey",
     [
@@ -5,10 +5,21 @@ from py_ecc.bls.g2_primitives import (
     G2_to_signature,
     pubkey_to_G1,
     signature_to_G2,
+    subgroup_check,
+    subgroup_check_G1,
+    subgroup_check_G2,
+)
+from py_ecc.bls.hash_to_curve import (
+    map_to_curve_G1,
+    map_to_curve_G2,
 )
 from py_ecc.optimized_bls12_381 import (
+    FQ,
+    FQ2,
     G1,
     G2,
+    Z1,
+    Z2,
     multiply,
     normalize,
 )
@@ -29,3 +40,19 @@ def test_G1_pubkey_encode_decode():
     G1_point = multiply(G1, 42)
     pubkey = G1_to_pubkey(G1_point)
     assert normalize(pubkey_to_G1(pubkey)) == normalize(G1_point)
+
+
+@pytest.mark.parametrize("u", [1, 5, 2**200 + 1])
+def test_subgroup_check(u):
+    # Points of E and E' before cofactor clearing, almost surely outside G1 and G2
+    P = map_to_curve_G1(FQ(u))
+    Q = map_to_curve_G2(FQ2([u, u + 1]))
+    assert not subgroup_check(P)
+    assert not subgroup_check_G1(P)
+    assert not subgroup_check(Q)
+    assert not subgroup_check_G2(Q)
+    for n in (1, u):
+        assert subgroup_check_G1(multiply(G1, n))
+        assert subgroup_check_G2(multiply(G2, n))
+    assert subgroup_check_G1(Z1)
+    assert subgroup_check_G2(Z2)
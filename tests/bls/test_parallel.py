@@ -0,0 +1,56 @@
+import pytest
+
+from py_ecc.bls import (
+    G2Basic,
+    G2ProofOfPossession,
+    ParallelVerifier,
+)
+
+SKs = [3, 17, 2021]
+PKs = [G2ProofOfPossession.SkToPk(SK) for SK in SKs]
+messages = [bytes([i]) * 32 for i in range(len(SKs))]
+signatures = [G2ProofOfPossession.Sign(SK, m) for SK, m in zip(SKs, messages)]
+
+
+@pytest.fixture(scope="module")
+def verifier():
+    with ParallelVerifier(G2ProofOfPossession, processes=2) as verifier:
+        yield verifier
+
+
+def test_parallel_verify(verifier):
+    jobs = list(zip(PKs, messages, signatures)) + [(PKs[0], messages[1], signatures[0])]
+    expected = [True, True, True, False]
+    assert list(verifier.map("Verify", jobs)) == expected
+    assert list(verifier.map("Verify", jobs, chunksize=2)) == expected
+    assert sorted(verifier.as_completed("Verify", jobs)) == list(enumerate(expected))
+
+
+def test_parallel_aggregate_verify(verifier):
+    aggregate = G2ProofOfPossession.Aggregate(signatures)
+    assert verifier.submit("AggregateVerify", PKs, messages, aggregate).result()
+    fast_aggregate = G2ProofOfPossession.Aggregate(
+        [G2ProofOfPossession.Sign(SK, messages[0]) for SK in SKs]
+    )
+    assert verifier.submit(
+        "FastAggregateVerify", PKs, messages[0], fast_aggregate
+    ).result()
+    assert not verifier.submit(
+        "FastAggregateVerify", PKs, messages[1], fast_aggregate
+    ).result()
+    # The warmed-up pool can also run the Miller loops of a single verification
+    executor = verifier.executor
+    assert G2ProofOfPossession.AggregateVerify(
+        PKs, messages, aggregate, executor=executor
+    )
+    assert not G2ProofOfPossession.AggregateVerify(
+        PKs, messages[::-1], aggregate, executor=executor
+    )
+
+
+def test_parallel_verifier_methods():
+    with ParallelVerifier(G2Basic, processes=1) as verifier:
+        with pytest.raises(ValueError):
+            verifier.submit("FastAggregateVerify", PKs, messages[0], signatures[0])
+        with pytest.raises(ValueError):
+            verifier.submit("SkToPk", 1)
@@ -8,8 +8,11 @@ from py_ecc.bls.constants import (
 )
 from py_ecc.bls.point_compression import (
     compress_G1,
+    compress_G1_batch,
     compress_G2,
+    compress_G2_batch,
     decompress_G1,
+    decompress_G1_batch,
     decompress_G2,
 )
 from py_ecc.fields import (
@@ -190,3 +193,20 @@ def test_decompress_G2_edge_case(z, error_message):
     else:
         with pytest.raises(ValueError, match=error_message):
             decompress_G2(z)
+
+
+def test_compress_batch():
+    G1_points = [multiply(G1, n) for n in range(1, 6)] + [Z1, G1]
+    assert compress_G1_batch(G1_points) == [compress_G1(pt) for pt in G1_points]
+    G2_points = [multiply(G2, n) for n in range(1, 4)] + [Z2, G2]
+    assert compress_G2_batch(G2_points) == [compress_G2(pt) for pt in G2_points]
+    assert compress_G1_batch([]) == []
+    with pytest.raises(ValueError, match="not on the twisted curve"):
+        compress_G2_batch([G2, (FQ2([1, 1]), FQ2([1, 1]), FQ2([1, 1]))])
+
+
+def test_decompress_G1_batch():
+    zs = compress_G1_batch([G1, Z1, multiply(G1, 3)])
+    # c_flag unset
+    zs.append(POW_2_381)
+    assert decompress_G1_batch(zs) == [decompress_G1(z) for z in zs[:3]] + [None]
@@ -16,13 +16,19 @@ from py_ecc.fields import (
     optimized_bls12_381_FQ,
     optimized_bls12_381_FQ2,
     optimized_bls12_381_FQ12,
+    optimized_bls12_381_FQP,
     optimized_bn128_FQ,
     optimized_bn128_FQ2,
     optimized_bn128_FQ12,
+    optimized_bn128_FQP,
+    optimized_FQP,
 )
 from py_ecc.fields.field_properties import (
     field_properties,
 )
+from py_ecc.fields.optimized_field_elements import (
+    batch_inv,
+)
 
 
 @pytest.fixture(params=[bn128, optimized_bn128, bls12_381, optimized_bls12_381])
@@ -172,6 +178,29 @@ def twist(lib):
     return lib.twist
 
 
+# The FQ, FQP, FQ2 and FQ12 classes of the optimized libraries, for the tests of
+# their specific methods
+@pytest.fixture(
+    params=[
+        (
+            optimized_bn128_FQ,
+            optimized_bn128_FQP,
+            optimized_bn128_FQ2,
+            optimized_bn128_FQ12,
+        ),
+        (
+            optimized_bls12_381_FQ,
+            optimized_bls12_381_FQP,
+            optimized_bls12_381_FQ2,
+            optimized_bls12_381_FQ12,
+        ),
+    ],
+    ids=["optimized_bn128", "optimized_bls12_381"],
+)
+def optimized_fields(request):
+    return request.param
+
+
 def test_FQ_object(FQ, field_modulus):
     assert FQ(2) * FQ(2) == FQ(4)
     assert FQ(2) / FQ(7) + FQ(9) / FQ(7) == FQ(11) / FQ(7)
@@ -217,6 +246,78 @@ def test_FQ12_object(FQ12, field_modulus):
     # assert x ** (field_modulus ** 12 - 1) == one
 
 
+def test_optimized_field_objects_are_slotted(optimized_fields):
+    FQ, FQP, FQ2, FQ12 = optimized_fields
+    for x in (FQ(5), FQ2([1, 2]), FQ12(list(range(12)))):
+        assert not hasattr(x, "__dict__")
+        assert -x + x == x * 0
+    assert FQ._from_reduced(5) == FQ(5)
+    assert FQ2._from_reduced((1, 2)) == FQ2([1, 2])
+    assert FQ2.degree == 2 and FQ12.degree == 12
+    assert FQ12.mc_tuples == [
+        (i, c) for i, c in enumerate(FQ12.FQ12_MODULUS_COEFFS) if c
+    ]
+    # A bare FQP with an explicit modulus computes like the field of that modulus
+    x = FQP([1, 2], FQ2.FQ2_MODULUS_COEFFS)
+    y = FQP([3, 4], FQ2.FQ2_MODULUS_COEFFS)
+    assert not hasattr(x, "__dict__")
+    assert type(x) is type(y) and x.degree == 2
+    assert (x * y - x).coeffs == (FQ2([1, 2]) * FQ2([3, 4]) - FQ2([1, 2])).coeffs
+    assert (x.inv() * x).coeffs == (1, 0)
+
+
+def test_optimized_mul_and_square(optimized_fields):
+    _, _, FQ2, FQ12 = optimized_fields
+    for x, y in (
+        (FQ2([-3, 7]), FQ2([11, -5])),
+        (FQ12([3 * i - 17 for i in range(12)]), FQ12([(-5) ** i for i in range(12)])),
+    ):
+        # The schoolbook product of the base class
+        expected = optimized_FQP.__mul__(x, y)
+        assert x * y == expected
+        assert x.square() == optimized_FQP.__mul__(x, x)
+        assert optimized_FQP.square(x) == x.square()
+        assert x**5 == x * x * x * x * x
+
+
+def test_optimized_lazy_reduction(optimized_fields):
+    _, _, FQ2, FQ12 = optimized_fields
+    for x, y in (
+        (FQ2([-3, 7]), FQ2([11, -5])),
+        (FQ12([3 * i - 17 for i in range(12)]), FQ12([(-5) ** i for i in range(12)])),
+    ):
+        s = x.add_unreduced(y).add_unreduced(y)
+        d = x.sub_unreduced(y).sub_unreduced(y)
+        assert s.reduce() == x + y + y
+        assert d.reduce() == x - y - y
+        assert s * d == (x + y + y) * (x - y - y)
+        assert s.square() == (x + y + y).square()
+
+
+def test_optimized_frobenius(optimized_fields):
+    _, _, FQ2, FQ12 = optimized_fields
+    q = FQ2.field_modulus
+    x = FQ2([-3, 7])
+    assert x.frobenius() == x**q
+    assert x.frobenius(2) == x
+    f = FQ12([3 * i - 17 for i in range(12)])
+    assert f.frobenius() == f**q
+    assert f.frobenius(2) == f.frobenius().frobenius()
+    assert f.frobenius(5).frobenius(7) == f.frobenius(0) == f
+
+
+def test_optimized_inv(optimized_fields):
+    _, _, FQ2, FQ12 = optimized_fields
+    for x in (FQ2([-3, 7]), FQ12([3 * i - 17 for i in range(12)])):
+        # The extended Euclidean algorithm of the base class
+        assert x.inv() == optimized_FQP.inv(x)
+        assert x * x.inv() == x.one()
+        assert x.zero().inv() == x.zero()
+        elements = [x, x.zero(), x + x.one(), x.square()]
+        assert batch_inv(elements) == [y.inv() for y in elements]
+    assert batch_inv([]) == []
+
+
 def test_G1_object(G1, eq, double, add, multiply, curve_order, is_inf):
     assert eq(add(add(double(G1), G1), G1), double(double(G1)))
     assert not eq(double(G1), G1)
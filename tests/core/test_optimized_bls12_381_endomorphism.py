@@ -0,0 +1,78 @@
+import pytest
+
+from py_ecc.bls.hash_to_curve import (
+    map_to_curve_G1,
+    map_to_curve_G2,
+)
+from py_ecc.optimized_bls12_381 import (
+    FQ,
+    FQ2,
+    G1,
+    G2,
+    b2,
+    curve_order,
+    eq,
+    gls_decompose,
+    glv_decompose,
+    is_on_curve,
+    multiply,
+    multiply_clear_cofactor_G1,
+    multiply_clear_cofactor_G2,
+    multiply_gls_G2,
+    multiply_glv_G1,
+    phi,
+    psi,
+    psi_clear_cofactor_G2,
+)
+from py_ecc.optimized_bls12_381.constants import (
+    BLS_X,
+    H_EFF_G1,
+)
+
+SCALARS = [0, 1, 2, 2**127 + 5, curve_order - 1, curve_order, 2**300 + 3]
+
+
+def test_phi_acts_as_scalar_multiplication_on_G1():
+    P = multiply(G1, 123)
+    assert eq(phi(P), multiply(P, -(BLS_X**2) % curve_order))
+
+
+@pytest.mark.parametrize("n", SCALARS)
+def test_glv_decompose(n):
+    n0, n1 = glv_decompose(n)
+    assert (n0 + n1 * BLS_X**2 - n) % curve_order == 0
+    assert 0 <= n0 < 2**128
+    assert 0 <= n1 < 2**128
+
+
+@pytest.mark.parametrize("n", SCALARS)
+def test_multiply_glv_G1(n):
+    P = multiply(G1, 777)
+    assert eq(multiply_glv_G1(P, n), multiply(P, n))
+
+
+def test_psi_acts_as_scalar_multiplication_on_G2():
+    Q = multiply(G2, 123)
+    assert is_on_curve(psi(Q), b2)
+    assert eq(psi(Q), multiply(Q, BLS_X % curve_order))
+
+
+@pytest.mark.parametrize("n", SCALARS)
+def test_gls_decompose(n):
+    digits = gls_decompose(n)
+    assert sum(d * (-BLS_X) ** i for i, d in enumerate(digits)) == n % curve_order
+    assert all(0 <= d < 2**64 for d in digits)
+
+
+@pytest.mark.parametrize("n", SCALARS)
+def test_multiply_gls_G2(n):
+    Q = multiply(G2, 777)
+    assert eq(multiply_gls_G2(Q, n), multiply(Q, n))
+
+
+@pytest.mark.parametrize("u", [1, 7, 2**300])
+def test_clear_cofactor(u):
+    P = map_to_curve_G1(FQ(u))
+    assert eq(multiply_clear_cofactor_G1(P), multiply(P, H_EFF_G1))
+    Q = map_to_curve_G2(FQ2([u, 3]))
+    assert eq(psi_clear_cofactor_G2(Q), multiply_clear_cofactor_G2(Q))
@@ -0,0 +1,119 @@
+import pytest
+
+from py_ecc.optimized_bls12_381 import (
+    FQ,
+    FQ12,
+    G1,
+    G2,
+    Z1,
+    Z2,
+    add,
+    curve_order,
+    double,
+    eq,
+    field_modulus,
+    final_exponentiate,
+    miller_loop_prepared,
+    multi_miller_loop,
+    multi_miller_loop_prepared,
+    multi_pairing,
+    multiply,
+    neg,
+    normalize,
+    pairing,
+    prepare_G2,
+    tower_FQ12,
+)
+from py_ecc.optimized_bls12_381.optimized_pairing import (
+    add_step,
+    cyclotomic_exp,
+    double_step,
+    miller_loop,
+)
+
+
+def test_multi_pairing_matches_product_of_pairings():
+    P1, Q1 = multiply(G1, 5), multiply(G2, 7)
+    P2, Q2 = multiply(G1, 11), G2
+    assert multi_pairing([(Q1, P1), (Q2, P2)]) == pairing(Q1, P1) * pairing(Q2, P2)
+
+
+def test_multi_pairing_cancellation():
+    assert multi_pairing([(G2, G1), (G2, neg(G1))]) == FQ12.one()
+    assert multi_pairing([(multiply(G2, 3), G1), (G2, neg(multiply(G1, 3)))]) == (
+        FQ12.one()
+    )
+    assert multi_pairing([(G2, G1), (G2, G1)]) != FQ12.one()
+
+
+def test_multi_pairing_skips_points_at_infinity():
+    assert multi_pairing([]) == FQ12.one()
+    assert multi_pairing([(Z2, G1), (G2, Z1)]) == FQ12.one()
+    assert multi_pairing([(G2, G1), (Z2, G1)]) == pairing(G2, G1)
+
+
+def test_multi_pairing_without_final_exponentiation():
+    pairs = [(G2, multiply(G1, 2)), (multiply(G2, 2), neg(G1))]
+    f = multi_pairing(pairs, final_exponentiate=False)
+    assert f != FQ12.one()
+    assert multi_pairing(pairs) == FQ12.one()
+
+
+def test_multi_pairing_rejects_points_off_curve():
+    with pytest.raises(ValueError, match="point P is not on the correct curve"):
+        multi_pairing([(G2, G1), (G2, (FQ(1), FQ(1), FQ(1)))])
+
+
+def test_final_exponentiate_matches_generic_exponentiation():
+    f = FQ12(list(range(1, 13)))
+    assert final_exponentiate(f) == f ** ((field_modulus**12 - 1) // curve_order)
+    assert final_exponentiate(FQ12.zero()) == FQ12.zero()
+
+
+def test_cyclotomic_exp():
+    f = FQ12(list(range(1, 13)))
+    # Map f into the cyclotomic subgroup with the easy part of the exponentiation
+    g = tower_FQ12.from_fqp(f ** ((field_modulus**6 - 1) * (field_modulus**2 + 1)))
+    assert g.conjugate() * g == tower_FQ12.one()
+    assert cyclotomic_exp(g, 5) == g**5
+    assert cyclotomic_exp(g, -5) == (g**5).inv()
+
+
+def test_miller_loop_steps_match_point_arithmetic():
+    R = multiply(G2, 3)
+    R2, _ = double_step(R)
+    assert eq(R2, double(R))
+    R3, _ = add_step(R2, normalize(G2))
+    assert eq(R3, add(double(R), G2))
+
+
+def test_miller_loop_is_bilinear():
+    assert final_exponentiate(miller_loop(G2, multiply(G1, 6), False)) == (
+        final_exponentiate(miller_loop(multiply(G2, 3), multiply(G1, 2), False))
+    )
+    assert miller_loop(Z2, G1) == FQ12.one()
+
+
+def test_miller_loop_prepared():
+    Q = multiply(G2, 9)
+    prepared_Q = prepare_G2(Q)
+    for P in (G1, multiply(G1, 4)):
+        assert miller_loop_prepared(prepared_Q, P, False) == miller_loop(Q, P, False)
+    assert miller_loop_prepared(prepared_Q, G1) == pairing(Q, G1)
+    assert prepare_G2(Z2) == ()
+    assert miller_loop_prepared(prepare_G2(Z2), G1) == FQ12.one()
+    assert miller_loop_prepared(prepared_Q, Z1) == FQ12.one()
+    # The prepared lines are made of reduced field elements
+    assert all(
+        0 <= c < field_modulus
+        for line in prepared_Q
+        for coeff in line
+        for c in coeff.coeffs
+    )
+
+
+def test_multi_miller_loop_prepared():
+    pairs = [(G2, multiply(G1, 2)), (multiply(G2, 2), neg(G1))]
+    f = multi_miller_loop_prepared([(prepare_G2(Q), P) for Q, P in pairs])
+    assert f == multi_miller_loop(pairs)
+    assert final_exponentiate(f) == FQ12.one()
@@ -0,0 +1,93 @@
+import pytest
+
+from py_ecc import (
+    optimized_bls12_381,
+    optimized_bn128,
+)
+
+
+@pytest.fixture(params=[optimized_bn128, optimized_bls12_381])
+def lib(request):
+    return request.param
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 5, 31, 2**64 - 1, 12345678901234567890123])
+@pytest.mark.parametrize("width", [2, 5])
+def test_wnaf(n, width):
+    digits = optimized_bn128.wnaf(n, width)
+    assert sum(digit * 2**i for i, digit in enumerate(digits)) == n
+    for i, digit in enumerate(digits):
+        if digit:
+            assert digit % 2 == 1
+            assert abs(digit) < 2 ** (width - 1)
+            assert not any(digits[i + 1 : i + width])
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 100, 2**200 + 17])
+def test_multiply_wnaf(lib, n):
+    for pt in (lib.G1, lib.G2):
+        assert lib.eq(lib.multiply_wnaf(pt, n), lib.multiply(pt, n))
+        assert lib.eq(lib.multiply_wnaf(pt, -n), lib.neg(lib.multiply(pt, n)))
+    assert lib.is_inf(lib.multiply_wnaf(lib.G1, lib.curve_order))
+    assert lib.is_inf(lib.multiply_wnaf(lib.Z2, n))
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 100, 2**200 + 17])
+def test_multiply_generators(lib, n):
+    assert lib.eq(lib.multiply_G1(n), lib.multiply(lib.G1, n))
+    assert lib.eq(lib.multiply_G2(n), lib.multiply(lib.G2, n))
+    assert lib.is_inf(lib.multiply_G1(lib.curve_order))
+
+
+def test_multiply_comb(lib):
+    pt = lib.multiply(lib.G1, 7)
+    table = lib.comb_table(pt, 4)
+    assert len(table) == 16
+    assert lib.eq(
+        lib.multiply_comb(table, 2**100 + 3), lib.multiply(pt, 2**100 + 3)
+    )
+
+
+def test_multiply_wnaf_simultaneous(lib):
+    terms = [(lib.G1, 3), (lib.multiply(lib.G1, 5), -7), (lib.Z1, 9), (lib.G1, 0)]
+    assert lib.eq(
+        lib.multiply_wnaf_simultaneous(terms), lib.neg(lib.multiply(lib.G1, 32))
+    )
+    assert lib.eq(
+        lib.multiply_wnaf_simultaneous([(lib.G2, 2**70 + 1), (lib.G2, 2**3)]),
+        lib.multiply(lib.G2, 2**70 + 9),
+    )
+
+
+@pytest.mark.parametrize("window", [None, 1, 3, 8])
+def test_multi_scalar_multiply(lib, window):
+    scalars = [3**i * (-1) ** i for i in range(20)] + [0, lib.curve_order - 1]
+    for G, Z in ((lib.G1, lib.Z1), (lib.G2, lib.Z2)):
+        points = [lib.multiply(G, i + 1) for i in range(len(scalars) - 1)] + [Z]
+        expected = lib.multiply(
+            G, sum((i + 1) * n for i, n in enumerate(scalars[:-1])) % lib.curve_order
+        )
+        assert lib.eq(lib.multi_scalar_multiply(points, scalars, window), expected)
+    assert lib.eq(
+        lib.multi_scalar_multiply([lib.G1, lib.G1], [2, 5], window),
+        lib.multiply(lib.G1, 7),
+    )
+
+
+def test_multi_scalar_multiply_invalid_input(lib):
+    with pytest.raises(ValueError):
+        lib.multi_scalar_multiply([lib.G1], [1, 2])
+    with pytest.raises(ValueError):
+        lib.multi_scalar_multiply([], [])
+
+
+def test_msm_window_size(lib):
+    assert lib.msm_window_size(1) == 2
+    assert lib.msm_window_size(4096) == 9
+
+
+def test_batch_normalize(lib):
+    for G, Z in ((lib.G1, lib.Z1), (lib.G2, lib.Z2)):
+        points = [lib.multiply(G, n) for n in range(1, 5)] + [Z, lib.double(G)]
+        assert lib.batch_normalize(points) == [lib.normalize(pt) for pt in points]
+    assert lib.batch_normalize([]) == []
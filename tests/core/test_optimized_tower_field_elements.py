@@ -0,0 +1,115 @@
+import pytest
+
+from py_ecc.fields import (
+    optimized_bls12_381_FQ2,
+    optimized_bls12_381_FQ6,
+    optimized_bls12_381_FQ12,
+    optimized_bls12_381_tower_FQ2,
+    optimized_bls12_381_tower_FQ12,
+    optimized_bn128_FQ2,
+    optimized_bn128_FQ6,
+    optimized_bn128_FQ12,
+    optimized_bn128_tower_FQ2,
+    optimized_bn128_tower_FQ12,
+)
+
+
+@pytest.fixture(
+    params=[
+        (
+            optimized_bn128_FQ2,
+            optimized_bn128_FQ12,
+            optimized_bn128_tower_FQ2,
+            optimized_bn128_FQ6,
+            optimized_bn128_tower_FQ12,
+        ),
+        (
+            optimized_bls12_381_FQ2,
+            optimized_bls12_381_FQ12,
+            optimized_bls12_381_tower_FQ2,
+            optimized_bls12_381_FQ6,
+            optimized_bls12_381_tower_FQ12,
+        ),
+    ],
+    ids=["bn128", "bls12_381"],
+)
+def fields(request):
+    return request.param
+
+
+def test_tower_FQ2_matches_flat_FQ2(fields):
+    FQ2, _, tower_FQ2, _, _ = fields
+    x, y = FQ2([3, 7]), FQ2([-5, 11])
+    tx, ty = tower_FQ2.from_fqp(x), tower_FQ2.from_fqp(y)
+    assert tx.to_fqp() == x
+    assert (tx + ty).to_fqp() == x + y
+    assert (tx - ty).to_fqp() == x - y
+    assert (tx * ty).to_fqp() == x * y
+    assert (tx * 5).to_fqp() == x * 5
+    assert tx.square().to_fqp() == x * x
+    assert (tx / ty).to_fqp() == x / y
+    assert (tx**9).to_fqp() == x**9
+    assert tx * tx.inv() == tower_FQ2.one()
+
+
+def test_FQ6(fields):
+    _, _, _, FQ6, _ = fields
+    x = FQ6([1, 2, 3, 4, 5, 6])
+    y = FQ6([-7, 8, 0, 9, 1, -1])
+    assert x * x.inv() == FQ6.one()
+    assert (x * y) / y == x
+    assert x * (y + FQ6.one()) == x * y + x
+    assert x.mul_by_v() * y == (x * y).mul_by_v()
+    assert FQ6.zero().inv() == FQ6.zero()
+
+
+def test_tower_FQ12_matches_flat_FQ12(fields):
+    _, FQ12, _, _, tower_FQ12 = fields
+    x = FQ12(list(range(1, 13)))
+    y = FQ12([-1, 0, 5, 0, 0, 7, 2, 0, 0, -9, 0, 3])
+    tx, ty = tower_FQ12.from_fqp(x), tower_FQ12.from_fqp(y)
+    assert tx.to_fqp() == x
+    assert tower_FQ12.one().to_fqp() == FQ12.one()
+    assert (tx + ty).to_fqp() == x + y
+    assert (tx - ty).to_fqp() == x - y
+    assert (-tx).to_fqp() == -x
+    assert (tx * ty).to_fqp() == x * y
+    assert (tx * 3).to_fqp() == x * 3
+    assert tx.square().to_fqp() == x * x
+    assert tx.inv().to_fqp() == x.inv()
+    assert tower_FQ12.zero().inv().to_fqp() == FQ12.zero().inv() == FQ12.zero()
+    assert (tx / ty).to_fqp() == x / y
+    assert (tx**7).to_fqp() == x**7
+
+
+def test_tower_FQ12_cyclotomic_square(fields):
+    _, FQ12, _, _, tower_FQ12 = fields
+    q = FQ12.field_modulus
+    x = tower_FQ12.from_fqp(FQ12(list(range(1, 13))))
+    assert x.conjugate().to_fqp() == x.to_fqp() ** (q**6)
+    # Elements raised to (q**6 - 1) * (q**2 + 1) lie in the cyclotomic subgroup
+    g = x.conjugate() / x
+    g = tower_FQ12.from_fqp(g.to_fqp() ** (q**2)) * g
+    assert g.cyclotomic_square() == g.square()
+    assert g * g.conjugate() == tower_FQ12.one()
+
+
+@pytest.mark.parametrize(
+    "nonzero",
+    [
+        (0, 1, 4),
+        (0, 3, 5),
+        (1,),
+        (5,),
+        (0, 1, 2, 3, 4, 5),
+    ],
+)
+def test_tower_FQ12_mul_by_sparse(fields, nonzero):
+    _, FQ12, _, _, tower_FQ12 = fields
+    x = tower_FQ12.from_fqp(FQ12(list(range(1, 13))))
+    # Non-zero FQ2 coefficients at the given powers of w
+    coeffs = [0] * 12
+    for k in nonzero:
+        coeffs[k], coeffs[k + 6] = 3 * k + 1, 5 - k
+    y = tower_FQ12.from_fqp(FQ12(coeffs))
+    assert x.mul_by_sparse(y) == x * y